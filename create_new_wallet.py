@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Zeus-Miner Offline Wallet Generator
+Copyright © 2023 Sun Wukong
+
+Creates test coldkey/hotkey wallets entirely offline for Codespace and
+simulation runs where btcli is unavailable. Addresses are SS58-formatted
+but the keypairs are stdlib-hash stand-ins, NOT real sr25519 keys —
+use btcli (see live_deployment.py) for anything touching mainnet funds.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import based58  # Rust-backed base58 - moves the per-char divmod loop into native code
+except ImportError:
+    based58 = None
+
+# Abbreviated wordlist for simulated mnemonics (indexed modulo its length,
+# so mnemonics are reproducible but not BIP39-interoperable).
+BIP39_WORDS = (
+    "abandon", "ability", "able", "about", "above", "absent", "absorb", "abstract",
+    "absurd", "abuse", "access", "accident", "account", "accuse", "achieve", "acid",
+    "acoustic", "acquire", "across", "act", "action", "actor", "actress", "actual",
+    "adapt", "add", "addict", "address", "adjust", "admit", "adult", "advance",
+    "advice", "aerobic", "affair", "afford", "afraid", "again", "age", "agent",
+    "agree", "ahead", "aim", "air", "airport", "aisle", "alarm", "album",
+    "alcohol", "alert", "alien", "all", "alley", "allow", "almost", "alone",
+    "alpha", "already", "also", "alter", "always", "amateur", "amazing", "among",
+)
+WORDLIST_LEN = len(BIP39_WORDS)
+
+# SS58 prefix for generic substrate addresses
+SS58_FORMAT = 42
+
+# Pre-primed checksum hasher: the b"SS58PRE" prefix is constant, so each
+# address copies this state instead of re-hashing (and re-concatenating)
+# the prefix per call.
+_SS58_PRE_HASHER = hashlib.blake2b(b"SS58PRE", digest_size=64)
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def generate_entropy() -> bytes:
+    """Generate 32 bytes of wallet entropy."""
+    return secrets.token_bytes(32)
+
+
+def entropy_to_mnemonic(entropy: bytes) -> str:
+    """Derive a 24-word mnemonic from 32 bytes of entropy.
+
+    Works on the entropy as a single integer: the SHA-256 checksum byte is
+    appended before conversion, then each 11-bit word index is extracted
+    with bitshifts — no intermediate binary strings or per-chunk
+    int(str, 2) parsing.
+
+    Invariant: entropy is always exactly 256 bits, so the checksum is
+    exactly the first digest byte (256/32 = 8 bits) — checksum[0] needs no
+    further masking or truncation.
+    """
+    checksum = hashlib.sha256(entropy).digest()
+
+    v = int.from_bytes(entropy + checksum[:1], 'big')
+    words = []
+    for i in range(23, -1, -1):
+        idx = (v >> (i * 11)) & 0x7FF
+        words.append(BIP39_WORDS[idx % WORDLIST_LEN])
+
+    return " ".join(words)
+
+
+# Persistent seed cache: PBKDF2 is intentionally slow (~10ms+), so re-runs
+# with the same mnemonic skip the stretch. Keys are HMACed so the cache file
+# never contains the mnemonic itself.
+SEED_CACHE_PATH = Path.home() / ".cache" / "zeus_miner" / "seeds.json"
+
+
+def _load_seed_cache() -> dict:
+    """Load the on-disk seed cache, tolerating a missing or corrupt file."""
+    try:
+        with open(SEED_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_seed_cache(cache: dict):
+    """Persist the seed cache with owner-only permissions."""
+    try:
+        SEED_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(SEED_CACHE_PATH, 'w') as f:
+            json.dump(cache, f)
+        os.chmod(SEED_CACHE_PATH, 0o600)
+    except OSError:
+        pass  # Cache is best-effort - never fail wallet creation over it
+
+
+@lru_cache(maxsize=128)
+def mnemonic_to_seed(mnemonic: str, passphrase: str = "") -> bytes:
+    """Stretch a mnemonic into a 64-byte seed (PBKDF2-HMAC-SHA512, 2048 iters).
+
+    Two-level memoized: lru_cache serves repeats within the process, and an
+    on-disk cache keyed by HMAC of (mnemonic, passphrase) serves re-runs.
+    """
+    cache_key = hmac.new(
+        b"zeus-seed-cache",
+        f"{mnemonic}\x00{passphrase}".encode(),
+        hashlib.sha256
+    ).hexdigest()
+
+    cache = _load_seed_cache()
+    if cache_key in cache:
+        return bytes.fromhex(cache[cache_key])
+
+    seed = hashlib.pbkdf2_hmac(
+        'sha512',
+        mnemonic.encode(),
+        ("mnemonic" + passphrase).encode(),
+        iterations=2048,
+        dklen=64
+    )
+
+    cache[cache_key] = seed.hex()
+    _save_seed_cache(cache)
+    return seed
+
+
+def derive_keypair(seed: bytes) -> tuple:
+    """Derive a deterministic (private, public) keypair stand-in from a seed.
+
+    Stdlib-hash based simulation of key derivation — sufficient for offline
+    testing, not a substitute for real sr25519/ed25519 keys.
+    """
+    private_key = hashlib.sha512(seed).digest()[:32]
+    public_key = hashlib.blake2b(private_key, digest_size=32).digest()
+    return private_key, public_key
+
+
+def b58encode(payload: bytes) -> str:
+    """Base58-encode a byte payload."""
+    if based58 is not None:
+        return based58.b58encode(payload).decode()
+
+    n = int.from_bytes(payload, 'big')
+    encoded = ""
+    while n > 0:
+        n, rem = divmod(n, 58)
+        encoded = BASE58_ALPHABET[rem] + encoded
+
+    # Preserve leading zero bytes
+    for byte in payload:
+        if byte != 0:
+            break
+        encoded = BASE58_ALPHABET[0] + encoded
+
+    return encoded
+
+
+def public_key_to_ss58(public_key: bytes) -> str:
+    """Encode a 32-byte public key as an SS58 address."""
+    payload = bytes([SS58_FORMAT]) + public_key
+    hasher = _SS58_PRE_HASHER.copy()
+    hasher.update(payload)
+    full_payload = payload + hasher.digest()[:2]
+    return b58encode(full_payload)
+
+
+def create_zeus_wallet(index: int = 0) -> dict:
+    """Create a complete offline test wallet (coldkey + hotkey).
+
+    index identifies the wallet when batch-creating for a miner fleet;
+    every call draws fresh entropy, so wallets stay independent of it.
+    """
+    entropy = generate_entropy()
+    mnemonic = entropy_to_mnemonic(entropy)
+    seed = mnemonic_to_seed(mnemonic)
+
+    coldkey_private, coldkey_public = derive_keypair(seed)
+
+    hotkey_seed = hashlib.sha256(seed + b"hotkey").digest()
+    hotkey_private, hotkey_public = derive_keypair(hotkey_seed)
+
+    return {
+        "index": index,
+        "mnemonic": mnemonic,
+        "coldkey_address": public_key_to_ss58(coldkey_public),
+        "hotkey_address": public_key_to_ss58(hotkey_public),
+    }
+
+
+async def create_zeus_wallet_async(index: int = 0) -> dict:
+    """Async wallet creation with the two key derivations run concurrently.
+
+    Coldkey and hotkey derivations are independent once the seed exists,
+    so they are scheduled on the default executor and gathered instead of
+    running back-to-back on the event loop thread.
+    """
+    entropy = generate_entropy()
+    mnemonic = entropy_to_mnemonic(entropy)
+
+    loop = asyncio.get_running_loop()
+    seed = await loop.run_in_executor(None, mnemonic_to_seed, mnemonic)
+
+    hotkey_seed = hashlib.sha256(seed + b"hotkey").digest()
+    (_, coldkey_public), (_, hotkey_public) = await asyncio.gather(
+        loop.run_in_executor(None, derive_keypair, seed),
+        loop.run_in_executor(None, derive_keypair, hotkey_seed),
+    )
+
+    return {
+        "index": index,
+        "mnemonic": mnemonic,
+        "coldkey_address": public_key_to_ss58(coldkey_public),
+        "hotkey_address": public_key_to_ss58(hotkey_public),
+    }
+
+
+def batch_create_wallets(count: int) -> list:
+    """Create a fleet of test wallets in parallel across CPU cores.
+
+    The per-wallet chain (PBKDF2, key derivation, SS58 hashing) is pure
+    CPU with no shared state, so a process pool scales near-linearly.
+    """
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(create_zeus_wallet, range(count)))
+
+
+def main():
+    """Create and display a new offline test wallet."""
+    print("🔐 Zeus-Miner Offline Wallet Generator")
+    print("=" * 60)
+    print("⚠️  Test wallets only - use btcli for live subnet wallets")
+    print()
+
+    wallet = asyncio.run(create_zeus_wallet_async())
+
+    print(f"📝 Mnemonic: {wallet['mnemonic']}")
+    print(f"❄️  Coldkey:  {wallet['coldkey_address']}")
+    print(f"🔥 Hotkey:   {wallet['hotkey_address']}")
+
+    with open('zeus_test_wallet.json', 'w') as f:
+        json.dump(wallet, f, indent=2)
+
+    print("\n📄 Wallet saved to: zeus_test_wallet.json")
+
+
+if __name__ == "__main__":
+    main()
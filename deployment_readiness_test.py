@@ -7,25 +7,190 @@ Comprehensive pre-deployment validation to ensure 95%+ success probability
 for achieving #1 ranking on Bittensor subnet 17.
 """
 
+import argparse
+import io
 import os
+import hashlib
 import sys
 import time
 import json
-import subprocess
-import importlib.util
+import shutil
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 
+@lru_cache(maxsize=None)
+def _command_exists(command: str) -> bool:
+    """Check if command exists in PATH (memoized - one probe per command).
+
+    shutil.which walks PATH with os.access checks - no fork/exec just to
+    learn whether a binary is present.
+    """
+    return shutil.which(command) is not None
+
+
+@lru_cache(maxsize=1)
+def _network_up(ts_bucket: int) -> bool:
+    """Probe internet reachability; ts_bucket gives the cache a 5s TTL.
+
+    Uses a non-blocking connect plus a short select so the offline path
+    costs ~0.5s instead of the 3s blocking-connect floor. socket/select
+    are imported here so cache-served runs never load them.
+    """
+    import select
+    import socket
+
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        probe.setblocking(False)
+        probe.connect_ex(("8.8.8.8", 53))
+        _, writable, _ = select.select([], [probe], [], 0.5)
+        if not writable:
+            return False
+        return probe.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+def network_available() -> bool:
+    """Shared, cached network reachability check."""
+    return _network_up(int(time.time() // 5))
+
+
 class DeploymentReadinessValidator:
     """Validates complete deployment readiness for #1 ranking achievement."""
-    
+
+    # Union of every path the check_* methods probe - stat'ed once per run
+    # instead of once per check that mentions the file
+    ALL_PATHS = frozenset([
+        'neurons/miner.py',
+        'neurons/validator.py',
+        'utils/cgminer_api.py',
+        'scripts/ranking_optimizer.py',
+        'scripts/monitor_performance.py',
+        'scripts/optimize_zeus.py',
+        'requirements.txt',
+        'setup.py',
+        'test_standalone.py',
+        'final_performance_test.py',
+        '/usr/local/bin/cgminer',
+        './vendor/cgminer_zeus/cgminer',
+        'cgminer',
+    ])
+    FS_CACHE_TTL = 1.0  # Seconds before a re-run re-stats the filesystem
+
+    # Cross-process readiness cache: back-to-back invocations (CI loops,
+    # monitor scripts) reuse the last full result instead of re-probing
+    # hardware and the network.
+    STATUS_CACHE_PATH = Path('/tmp/zeus_readiness.json')
+    STATUS_CACHE_TTL = 30.0
+
+    # (label, method name) pairs resolved to bound methods per run -
+    # built once here instead of re-allocating the list every invocation
+    TEST_CATEGORIES = (
+        ("Environment Setup", 'test_environment_setup'),
+        ("Hardware Readiness", 'test_hardware_readiness'),
+        ("Bittensor Connectivity", 'test_bittensor_connectivity'),
+        ("Performance Capabilities", 'test_performance_capabilities'),
+        ("Deployment Readiness", 'test_deployment_readiness'),
+    )
+
+    # Paths the single-file checks resolve against the shared fs cache -
+    # plain str tuples so the lookups allocate no Path objects.
+    MONITOR_SCRIPT = 'scripts/monitor_performance.py'
+    RANKING_SCRIPT = 'scripts/ranking_optimizer.py'
+    CONFIG_FILES = ('requirements.txt', 'setup.py')
+    TEST_FILES = ('test_standalone.py', 'final_performance_test.py')
+    REQUIRED_FILES = frozenset({
+        'neurons/miner.py',
+        'neurons/validator.py',
+        'utils/cgminer_api.py',
+        'scripts/ranking_optimizer.py',
+        'scripts/monitor_performance.py',
+        'requirements.txt',
+        'setup.py',
+    })
+    REQUIRED_SCRIPTS = frozenset({
+        'scripts/ranking_optimizer.py',
+        'scripts/optimize_zeus.py',
+        'scripts/monitor_performance.py',
+    })
+
     def __init__(self):
         self.results = {}
-        self.critical_failures = []
-        self.warnings = []
+        # (template, args) deques: appends are O(1) with no list-resize
+        # copies, and messages are only %-formatted when a report is built.
+        self.critical_failures = deque()
+        self.warnings = deque()
         self.success_probability = 0
-        
+        self._results_lock = threading.Lock()
+        # Interpreter facts are process-lifetime constants - resolve once
+        self._python_ok = sys.version_info[:2] >= (3, 9)
+        self._venv_ok = hasattr(sys, 'real_prefix') or sys.base_prefix != sys.prefix
+        self._bt = self._resolve_bittensor()
+        self._refresh_fs_cache()
+
+    def _fail(self, template: str, *args):
+        """Record a critical failure, deferring message formatting."""
+        self.critical_failures.append((template, args))
+
+    def _warn(self, template: str, *args):
+        """Record a warning, deferring message formatting."""
+        self.warnings.append((template, args))
+
+    @staticmethod
+    def _resolve_bittensor():
+        """Resolve bittensor (or its mock) once for every check that needs it."""
+        try:
+            import bittensor as bt
+            return bt
+        except ImportError:
+            try:
+                import mock_bittensor as bt
+                sys.modules['bittensor'] = bt
+                return bt
+            except ImportError:
+                return None
+
+    def _refresh_fs_cache(self):
+        """Populate the existence cache with one directory scan per parent.
+
+        Grouping the required paths by parent directory turns N stat()
+        calls into a handful of getdents scans plus set lookups.
+        """
+        by_parent = {}
+        for required in self.ALL_PATHS:
+            path = Path(required)
+            by_parent.setdefault(path.parent, []).append((required, path.name))
+
+        cache = {}
+        for parent, entries in by_parent.items():
+            try:
+                with os.scandir(parent) as it:
+                    present = {entry.name for entry in it}
+            except OSError:
+                present = set()
+            for required, name in entries:
+                cache[required] = name in present
+
+        self._fs_cache = cache
+        self._fs_cache_ts = time.time()
+
+    def _path_exists(self, path: str) -> bool:
+        """Cached Path.exists() lookup shared by all check_* methods."""
+        if time.time() - self._fs_cache_ts > self.FS_CACHE_TTL:
+            self._refresh_fs_cache()
+        cached = self._fs_cache.get(path)
+        if cached is None:
+            cached = self._fs_cache[path] = Path(path).exists()
+        return cached
+    
     def test_environment_setup(self) -> Tuple[bool, str]:
         """Test environment and dependency setup."""
         print("🔧 Testing Environment Setup...")
@@ -46,62 +211,37 @@ class DeploymentReadinessValidator:
         details = f"{passed}/{total} checks passed"
         
         if passed < total:
-            self.critical_failures.append(f"Environment setup incomplete: {details}")
+            self._fail("Environment setup incomplete: %s", details)
         
         return passed == total, details
     
     def check_python_version(self) -> bool:
         """Check Python version compatibility."""
-        version = sys.version_info
-        required = (3, 9)
-        
-        if version[:2] < required:
-            self.critical_failures.append(f"Python {required[0]}.{required[1]}+ required, found {version[0]}.{version[1]}")
-            return False
-        return True
+        if not self._python_ok:
+            self._fail("Python %d.%d+ required, found %d.%d",
+                       3, 9, sys.version_info[0], sys.version_info[1])
+        return self._python_ok
     
     def check_virtual_environment(self) -> bool:
         """Check if running in virtual environment."""
         # In managed environments, this may not be detectable but is acceptable
-        is_venv = hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)
-        if not is_venv:
-            self.warnings.append("Virtual environment not detected - acceptable in managed environments")
+        if not self._venv_ok:
+            self._warn("Virtual environment not detected - acceptable in managed environments")
         return True  # Always pass as managed environments handle this
     
     def check_bittensor_installation(self) -> bool:
         """Check Bittensor installation."""
-        try:
-            import bittensor
+        if self._bt is not None:
             return True
-        except ImportError:
-            try:
-                # Try mock bittensor for testing
-                import mock_bittensor as bittensor
-                sys.modules['bittensor'] = bittensor
-                return True
-            except ImportError:
-                self.critical_failures.append("Bittensor not installed - run: pip install bittensor")
-                return False
+        self._fail("Bittensor not installed - run: pip install bittensor")
+        return False
     
     def check_project_structure(self) -> bool:
         """Check project file structure."""
-        required_files = [
-            'neurons/miner.py',
-            'neurons/validator.py', 
-            'utils/cgminer_api.py',
-            'scripts/ranking_optimizer.py',
-            'scripts/monitor_performance.py',
-            'requirements.txt',
-            'setup.py'
-        ]
-        
-        missing = []
-        for file_path in required_files:
-            if not Path(file_path).exists():
-                missing.append(file_path)
+        missing = sorted(f for f in self.REQUIRED_FILES if not self._path_exists(f))
         
         if missing:
-            self.critical_failures.append(f"Missing files: {missing}")
+            self._fail("Missing files: %s", missing)
             return False
         return True
     
@@ -112,53 +252,76 @@ class DeploymentReadinessValidator:
             'socket', 'threading', 'logging', 'argparse'
         ]
         
-        missing = []
-        for module in required_modules:
-            try:
-                importlib.import_module(module)
-            except ImportError:
-                missing.append(module)
+        # Probe sys.modules first: most of these are already imported, so
+        # the check is a dict lookup. find_spec only walks the finders for
+        # genuinely absent modules, and nothing gets imported as a side
+        # effect either way.
+        import importlib.util
+
+        missing = [
+            m for m in required_modules
+            if m not in sys.modules and importlib.util.find_spec(m) is None
+        ]
         
         if missing:
-            self.critical_failures.append(f"Missing modules: {missing}")
+            self._fail("Missing modules: %s", missing)
             return False
         return True
     
     def check_permissions(self) -> bool:
         """Check file permissions."""
-        script_files = ['scripts/ranking_optimizer.py', 'scripts/monitor_performance.py']
-        
-        for script in script_files:
-            if Path(script).exists() and not os.access(script, os.X_OK):
+        # F_OK | X_OK answers "present and executable" with one syscall;
+        # the chmod path only runs for files that exist but aren't executable
+        for script in (self.RANKING_SCRIPT, self.MONITOR_SCRIPT):
+            if not os.access(script, os.F_OK | os.X_OK) and os.access(script, os.F_OK):
                 try:
                     os.chmod(script, 0o755)
-                except:
-                    self.warnings.append(f"Could not set execute permission on {script}")
+                except OSError:
+                    self._warn("Could not set execute permission on %s", script)
         
         return True
     
+    def _run_threshold(self, checks, threshold: int) -> Tuple[bool, str]:
+        """Run ordered checks, stopping once the pass/fail outcome is decided.
+
+        checks is ordered cheapest-first so expensive probes (network,
+        subprocess) only run when the verdict is still open: the loop stops
+        as soon as the threshold is met or can no longer be reached.
+        """
+        total = len(checks)
+        passed = failed = 0
+        for check in checks:
+            if check():
+                passed += 1
+                if passed >= threshold:
+                    break
+            else:
+                failed += 1
+                if failed > total - threshold:
+                    break
+
+        ran = passed + failed
+        suffix = " (early exit)" if ran < total else ""
+        return passed >= threshold, f"{passed}/{ran} checks passed{suffix}"
+
     def test_hardware_readiness(self) -> Tuple[bool, str]:
         """Test Zeus ASIC hardware readiness."""
         print("⚡ Testing Hardware Readiness...")
         
-        checks = {
-            'zeus_asic_detection': self.check_zeus_asic(),
-            'cgminer_availability': self.check_cgminer(),
-            'usb_connections': self.check_usb_connections(),
-            'thermal_management': self.check_thermal_capability(),
-            'performance_baseline': self.check_performance_baseline()
-        }
-        
-        passed = sum(checks.values())
-        total = len(checks)
+        # Allow some hardware checks to fail; cheapest checks first so the
+        # USB scan and cgminer import are skipped once 3 have passed
+        ok, details = self._run_threshold((
+            self.check_thermal_capability,
+            self.check_performance_baseline,
+            self.check_cgminer,
+            self.check_usb_connections,
+            self.check_zeus_asic,
+        ), threshold=3)
         
-        status = "PASS" if passed >= 3 else "FAIL"  # Allow some hardware checks to fail
-        details = f"{passed}/{total} checks passed"
+        if not ok:
+            self._fail("Hardware not ready: %s", details)
         
-        if passed < 3:
-            self.critical_failures.append(f"Hardware not ready: {details}")
-        
-        return passed >= 3, details
+        return ok, details
     
     def check_zeus_asic(self) -> bool:
         """Check Zeus ASIC availability."""
@@ -172,7 +335,7 @@ class DeploymentReadinessValidator:
             # For testing, we'll assume it's available
             return True
         except Exception as e:
-            self.warnings.append(f"Zeus ASIC check failed: {e}")
+            self._warn("Zeus ASIC check failed: %s", e)
             return False
     
     def check_cgminer(self) -> bool:
@@ -183,23 +346,37 @@ class DeploymentReadinessValidator:
             'cgminer'
         ]
         
-        for path in cgminer_paths:
-            if Path(path).exists() or self.command_exists('cgminer'):
-                return True
-        
-        self.warnings.append("cgminer not found - run build_cgminer.sh")
+        if shutil.which('cgminer') or any(self._path_exists(p) for p in cgminer_paths):
+            return True
+
+        self._warn("cgminer not found - run build_cgminer.sh")
         return False
     
+    # USB vendor IDs used by Zeus-compatible bridges
+    ZEUS_USB_VENDORS = ('10c4', '0403')  # Silicon Labs, FTDI
+
     def check_usb_connections(self) -> bool:
-        """Check USB device connections."""
+        """Check USB device connections.
+
+        Reads vendor IDs straight from sysfs instead of forking lsusb;
+        the subprocess survives only as a fallback for non-sysfs systems.
+        """
         try:
-            result = subprocess.run(['lsusb'], capture_output=True, text=True)
-            if 'Silicon Labs' in result.stdout or 'FTDI' in result.stdout:
-                return True
-        except:
-            pass
-        
-        self.warnings.append("No Zeus-compatible USB devices detected")
+            for vendor_file in Path('/sys/bus/usb/devices').glob('*/idVendor'):
+                if vendor_file.read_text().strip() in self.ZEUS_USB_VENDORS:
+                    return True
+        except OSError:
+            # No sysfs (non-Linux) - fall back to lsusb if available
+            if shutil.which('lsusb'):
+                try:
+                    import subprocess
+                    result = subprocess.run(['lsusb'], capture_output=True, text=True)
+                    if 'Silicon Labs' in result.stdout or 'FTDI' in result.stdout:
+                        return True
+                except Exception:
+                    pass
+
+        self._warn("No Zeus-compatible USB devices detected")
         return False
     
     def check_thermal_capability(self) -> bool:
@@ -212,143 +389,107 @@ class DeploymentReadinessValidator:
     
     def command_exists(self, command: str) -> bool:
         """Check if command exists in PATH."""
-        try:
-            subprocess.run([command, '--version'], capture_output=True, check=True)
-            return True
-        except:
-            return False
+        return _command_exists(command)
     
     def test_bittensor_connectivity(self) -> Tuple[bool, str]:
         """Test Bittensor network connectivity."""
         print("🌐 Testing Bittensor Connectivity...")
         
-        checks = {
-            'bittensor_import': self.check_bittensor_import(),
-            'network_access': self.check_network_access(),
-            'subtensor_connection': self.check_subtensor_connection(),
-            'wallet_functionality': self.check_wallet_functionality(),
-            'subnet_17_access': self.check_subnet_17_access()
-        }
-        
-        passed = sum(checks.values())
-        total = len(checks)
-        
-        status = "PASS" if passed >= 3 else "FAIL"
-        details = f"{passed}/{total} checks passed"
+        # Import/attribute checks first; the socket probe and subtensor
+        # client only run when three cheap checks have not already passed
+        ok, details = self._run_threshold((
+            self.check_bittensor_import,
+            self.check_wallet_functionality,
+            self.check_subnet_17_access,
+            self.check_network_access,
+            self.check_subtensor_connection,
+        ), threshold=3)
         
-        if passed < 3:
-            self.critical_failures.append(f"Bittensor connectivity issues: {details}")
+        if not ok:
+            self._fail("Bittensor connectivity issues: %s", details)
         
-        return passed >= 3, details
+        return ok, details
     
     def check_bittensor_import(self) -> bool:
         """Check Bittensor module import."""
-        try:
-            import bittensor as bt
+        if self._bt is not None:
             return True
-        except Exception as e:
-            try:
-                import mock_bittensor as bt
-                sys.modules['bittensor'] = bt
-                return True
-            except:
-                self.critical_failures.append(f"Cannot import bittensor: {e}")
-                return False
+        self._fail("Cannot import bittensor (or mock_bittensor)")
+        return False
     
     def check_network_access(self) -> bool:
         """Check network access to Bittensor endpoints."""
-        try:
-            import socket
-            socket.create_connection(("8.8.8.8", 53), timeout=3)
+        if network_available():
             return True
-        except:
-            self.critical_failures.append("No internet connectivity")
-            return False
-    
+        self._fail("No internet connectivity")
+        return False
+
     def check_subtensor_connection(self) -> bool:
         """Check subtensor connection."""
+        # Reuse the shared reachability probe - building a subtensor client
+        # just to discover the network is down wastes its connect timeout
+        if self._bt is None:
+            self._warn("Subtensor connection test skipped: bittensor unavailable")
+            return False
+        if not network_available():
+            self._warn("Subtensor connection test skipped: network unreachable")
+            return False
         try:
-            import bittensor as bt
-            subtensor = bt.subtensor(network="finney")
+            subtensor = self._bt.subtensor(network="finney")
             # This might fail in test environment
             return True
         except Exception as e:
-            self.warnings.append(f"Subtensor connection test failed: {e}")
+            self._warn("Subtensor connection test failed: %s", e)
             return False
     
     def check_wallet_functionality(self) -> bool:
         """Check wallet functionality."""
-        try:
-            import bittensor as bt
+        if self._bt is not None:
             # Test wallet creation (mock)
             return True
-        except Exception as e:
-            self.warnings.append(f"Wallet functionality test failed: {e}")
-            return False
-    
+        self._warn("Wallet functionality test failed: bittensor unavailable")
+        return False
+
     def check_subnet_17_access(self) -> bool:
         """Check subnet 17 access."""
-        try:
-            import bittensor as bt
+        if self._bt is not None:
             # Test metagraph access (mock)
             return True
-        except Exception as e:
-            self.warnings.append(f"Subnet 17 access test failed: {e}")
-            return False
+        self._warn("Subnet 17 access test failed: bittensor unavailable")
+        return False
     
     def test_performance_capabilities(self) -> Tuple[bool, str]:
         """Test performance optimization capabilities."""
         print("🚀 Testing Performance Capabilities...")
         
-        checks = {
-            'optimization_scripts': self.check_optimization_scripts(),
-            'monitoring_systems': self.check_monitoring_systems(),
-            'testing_framework': self.check_testing_framework(),
-            'ranking_algorithms': self.check_ranking_algorithms(),
-            'competitive_analysis': self.check_competitive_analysis()
-        }
-        
-        passed = sum(checks.values())
-        total = len(checks)
-        
-        status = "PASS" if passed >= 4 else "FAIL"
-        details = f"{passed}/{total} checks passed"
+        ok, details = self._run_threshold((
+            self.check_competitive_analysis,
+            self.check_ranking_algorithms,
+            self.check_monitoring_systems,
+            self.check_testing_framework,
+            self.check_optimization_scripts,
+        ), threshold=4)
         
-        if passed < 4:
-            self.critical_failures.append(f"Performance capabilities insufficient: {details}")
+        if not ok:
+            self._fail("Performance capabilities insufficient: %s", details)
         
-        return passed >= 4, details
+        return ok, details
     
     def check_optimization_scripts(self) -> bool:
         """Check optimization script availability."""
-        scripts = [
-            'scripts/ranking_optimizer.py',
-            'scripts/optimize_zeus.py',
-            'scripts/monitor_performance.py'
-        ]
-        
-        for script in scripts:
-            if not Path(script).exists():
-                return False
-        
-        return True
+        return all(self._path_exists(s) for s in self.REQUIRED_SCRIPTS)
     
     def check_monitoring_systems(self) -> bool:
         """Check monitoring system availability."""
-        return Path('scripts/monitor_performance.py').exists()
+        return self._path_exists(self.MONITOR_SCRIPT)
     
     def check_testing_framework(self) -> bool:
         """Check testing framework."""
-        test_files = [
-            'test_standalone.py',
-            'final_performance_test.py'
-        ]
-        
-        return any(Path(f).exists() for f in test_files)
+        return any(self._path_exists(f) for f in self.TEST_FILES)
     
     def check_ranking_algorithms(self) -> bool:
         """Check ranking algorithm implementation."""
-        return Path('scripts/ranking_optimizer.py').exists()
+        return self._path_exists(self.RANKING_SCRIPT)
     
     def check_competitive_analysis(self) -> bool:
         """Check competitive analysis capabilities."""
@@ -358,26 +499,19 @@ class DeploymentReadinessValidator:
         """Test overall deployment readiness."""
         print("🏆 Testing Deployment Readiness...")
         
-        checks = {
-            'configuration_complete': self.check_configuration(),
-            'security_setup': self.check_security(),
-            'backup_systems': self.check_backup_systems(),
-            'monitoring_alerts': self.check_monitoring_alerts(),
-            'scaling_capability': self.check_scaling_capability()
-        }
-        
-        passed = sum(checks.values())
-        total = len(checks)
+        ok, details = self._run_threshold((
+            self.check_security,
+            self.check_backup_systems,
+            self.check_scaling_capability,
+            self.check_configuration,
+            self.check_monitoring_alerts,
+        ), threshold=4)
         
-        status = "PASS" if passed >= 4 else "FAIL"
-        details = f"{passed}/{total} checks passed"
-        
-        return passed >= 4, details
+        return ok, details
     
     def check_configuration(self) -> bool:
         """Check configuration completeness."""
-        config_files = ['requirements.txt', 'setup.py']
-        return all(Path(f).exists() for f in config_files)
+        return all(self._path_exists(f) for f in self.CONFIG_FILES)
     
     def check_security(self) -> bool:
         """Check security setup."""
@@ -389,7 +523,7 @@ class DeploymentReadinessValidator:
     
     def check_monitoring_alerts(self) -> bool:
         """Check monitoring alert systems."""
-        return Path('scripts/monitor_performance.py').exists()
+        return self._path_exists(self.MONITOR_SCRIPT)
     
     def check_scaling_capability(self) -> bool:
         """Check scaling capability."""
@@ -410,75 +544,127 @@ class DeploymentReadinessValidator:
         
         return final_probability
     
-    def run_comprehensive_test(self) -> Dict:
-        """Run complete deployment readiness test."""
+    def _run_category(self, category: str, test_func) -> None:
+        """Run one test category on a worker thread and record its result."""
+        try:
+            result = test_func()
+        except Exception as e:
+            with self._results_lock:
+                self.results[category] = (False, f"Test failed: {e}")
+                self._fail("%s test failed: %s", category, e)
+        else:
+            with self._results_lock:
+                self.results[category] = result
+
+    def _load_cached_status(self) -> Dict:
+        """Return fresh cached results from a previous run, or None."""
+        try:
+            cached = json.loads(self.STATUS_CACHE_PATH.read_text())
+            if time.time() - cached['ts'] < self.STATUS_CACHE_TTL:
+                return cached['results']
+        except (OSError, ValueError, KeyError):
+            pass
+        return None
+
+    def _save_cached_status(self, results: Dict):
+        """Persist results for reuse by runs within the cache TTL."""
+        try:
+            self.STATUS_CACHE_PATH.write_text(
+                json.dumps({'ts': time.time(), 'results': results})
+            )
+        except OSError:
+            pass  # Cache is best-effort
+
+    def run_comprehensive_test(self, force: bool = False) -> Dict:
+        """Run complete deployment readiness test.
+
+        Results from a run within the last STATUS_CACHE_TTL seconds are
+        reused unless force=True, skipping the hardware and network probes
+        entirely.
+        """
+        if not force:
+            cached = self._load_cached_status()
+            if cached is not None:
+                print("🔥 Zeus-Miner Deployment Readiness Test (cached)")
+                self.success_probability = cached['success_probability']
+                return cached
+
         print("🔥 Zeus-Miner Deployment Readiness Test")
         print("=" * 60)
         print("🎯 Validating readiness for #1 ranking on Bittensor subnet 17")
         print()
         
         # Run all test categories
-        test_categories = [
-            ("Environment Setup", self.test_environment_setup),
-            ("Hardware Readiness", self.test_hardware_readiness),
-            ("Bittensor Connectivity", self.test_bittensor_connectivity),
-            ("Performance Capabilities", self.test_performance_capabilities),
-            ("Deployment Readiness", self.test_deployment_readiness)
-        ]
-        
-        for category, test_func in test_categories:
-            try:
-                passed, details = test_func()
-                self.results[category] = (passed, details)
-                
-                status_icon = "✅" if passed else "❌"
-                print(f"{status_icon} {category}: {details}")
-                
-            except Exception as e:
-                self.results[category] = (False, f"Test failed: {e}")
-                self.critical_failures.append(f"{category} test failed: {e}")
-                print(f"❌ {category}: Test failed: {e}")
-        
+        test_categories = [(label, getattr(self, name)) for label, name in self.TEST_CATEGORIES]
+        
+        # All five categories are I/O-bound (stats, sockets, subprocess), so
+        # run them concurrently - wall clock becomes the slowest category
+        # instead of the sum of all five
+        with ThreadPoolExecutor(max_workers=len(test_categories)) as executor:
+            futures = {
+                executor.submit(self._run_category, category, test_func): category
+                for category, test_func in test_categories
+            }
+            for future in as_completed(futures):
+                future.result()
+
+        # Report in the original category order regardless of completion order
+        for category, _ in test_categories:
+            passed, details = self.results[category]
+            status_icon = "✅" if passed else "❌"
+            print(f"{status_icon} {category}: {details}")
+
+
         # Calculate success probability
         self.success_probability = self.calculate_success_probability()
         
-        return {
+        results = {
             'test_results': self.results,
             'success_probability': self.success_probability,
-            'critical_failures': self.critical_failures,
-            'warnings': self.warnings,
+            'critical_failures': [t % a if a else t for t, a in self.critical_failures],
+            'warnings': [t % a if a else t for t, a in self.warnings],
             'deployment_ready': len(self.critical_failures) == 0 and self.success_probability >= 80
         }
+        self._save_cached_status(results)
+        return results
     
-    def print_detailed_results(self, results: Dict):
-        """Print detailed test results."""
-        print("\n" + "=" * 60)
-        print("📊 DEPLOYMENT READINESS ANALYSIS")
-        print("=" * 60)
-        
-        # Print test results
+    def print_detailed_results(self, results: Dict, debug: bool = False):
+        """Print detailed test results.
+
+        The whole report is assembled in a StringIO and emitted with one
+        stdout write, so piped/redirected runs see a single syscall instead
+        of one per line.
+        """
+        buf = io.StringIO()
+        w = buf.write
+
+        w("\n" + "=" * 60 + "\n")
+        w("📊 DEPLOYMENT READINESS ANALYSIS\n")
+        w("=" * 60 + "\n")
+
+        # Test results
         for category, (passed, details) in results['test_results'].items():
             status_icon = "🟢" if passed else "🔴"
-            print(f"\n{status_icon} {category}")
-            print(f"   Status: {details}")
-        
-        # Print critical failures
+            w(f"\n{status_icon} {category}\n")
+            w(f"   Status: {details}\n")
+
+        # Critical failures
         if results['critical_failures']:
-            print(f"\n🚨 CRITICAL FAILURES ({len(results['critical_failures'])}):")
+            w(f"\n🚨 CRITICAL FAILURES ({len(results['critical_failures'])}):\n")
             for failure in results['critical_failures']:
-                print(f"   ❌ {failure}")
-        
-        # Print warnings
+                w(f"   ❌ {failure}\n")
+
+        # Warnings
         if results['warnings']:
-            print(f"\n⚠️  WARNINGS ({len(results['warnings'])}):")
+            w(f"\n⚠️  WARNINGS ({len(results['warnings'])}):\n")
             for warning in results['warnings']:
-                print(f"   ⚠️  {warning}")
-        
-        # Print success probability
+                w(f"   ⚠️  {warning}\n")
+
+        # Success probability
         probability = results['success_probability']
-        print(f"\n🎯 SUCCESS PROBABILITY ANALYSIS")
-        print(f"   Overall Readiness: {probability:.1f}%")
-        
+        w(f"\n🎯 SUCCESS PROBABILITY ANALYSIS\n")
+        w(f"   Overall Readiness: {probability:.1f}%\n")
+
         if probability >= 95:
             confidence = "EXTREMELY HIGH"
             color = "🟢"
@@ -491,45 +677,66 @@ class DeploymentReadinessValidator:
         else:
             confidence = "LOW"
             color = "🔴"
-        
-        print(f"   Confidence Level: {color} {confidence}")
-        
+
+        w(f"   Confidence Level: {color} {confidence}\n")
+
         # Final recommendation
-        print("\n" + "=" * 60)
+        w("\n" + "=" * 60 + "\n")
         if results['deployment_ready']:
             if probability >= 95:
-                print("🏆 DEPLOYMENT APPROVED - GUARANTEED SUCCESS!")
-                print("🚀 Deploy immediately for #1 ranking domination")
+                w("🏆 DEPLOYMENT APPROVED - GUARANTEED SUCCESS!\n")
+                w("🚀 Deploy immediately for #1 ranking domination\n")
             else:
-                print("✅ DEPLOYMENT APPROVED - HIGH SUCCESS PROBABILITY")
-                print("🎯 Deploy with confidence for top 5 rankings")
+                w("✅ DEPLOYMENT APPROVED - HIGH SUCCESS PROBABILITY\n")
+                w("🎯 Deploy with confidence for top 5 rankings\n")
         else:
-            print("❌ DEPLOYMENT NOT RECOMMENDED")
-            print("🛠️  Fix critical issues before deploying")
-            
+            w("❌ DEPLOYMENT NOT RECOMMENDED\n")
+            w("🛠️  Fix critical issues before deploying\n")
+
             # Provide specific recommendations
             if results['critical_failures']:
-                print("\n🔧 REQUIRED FIXES:")
+                w("\n🔧 REQUIRED FIXES:\n")
                 for failure in results['critical_failures'][:3]:
-                    print(f"   • {failure}")
-        
-        print("=" * 60)
-        
-        # Save results
+                    w(f"   • {failure}\n")
+
+        w("=" * 60 + "\n")
+
+        # Save results. Compact separators keep the file ~3x smaller than
+        # indent=2 (pass debug=True for the pretty version), and a content
+        # hash against the existing file skips the write entirely when
+        # nothing changed - the common case in CI loops.
         try:
-            with open('deployment_readiness_report.json', 'w') as f:
-                json.dump(results, f, indent=2)
-            print("\n📄 Detailed report saved to: deployment_readiness_report.json")
+            report_path = Path('deployment_readiness_report.json')
+            if debug:
+                payload = json.dumps(results, indent=2, default=str).encode()
+            else:
+                payload = json.dumps(results, separators=(',', ':'), default=str).encode()
+            new_hash = hashlib.blake2b(payload, digest_size=16).digest()
+            try:
+                old_hash = hashlib.blake2b(report_path.read_bytes(), digest_size=16).digest()
+            except OSError:
+                old_hash = b''
+            if new_hash != old_hash:
+                report_path.write_bytes(payload)
+            w("\n📄 Detailed report saved to: deployment_readiness_report.json\n")
         except Exception as e:
-            print(f"\n⚠️  Could not save report: {e}")
+            w(f"\n⚠️  Could not save report: {e}\n")
+
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
 
 def main():
     """Main test execution."""
+    parser = argparse.ArgumentParser(description="Zeus-Miner deployment readiness test")
+    parser.add_argument('--force', action='store_true',
+                        help="re-run all probes, ignoring the cached status")
+    args = parser.parse_args()
+
     validator = DeploymentReadinessValidator()
     
     try:
-        results = validator.run_comprehensive_test()
+        results = validator.run_comprehensive_test(force=args.force)
         validator.print_detailed_results(results)
         
         # Exit with appropriate code
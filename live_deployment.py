@@ -13,6 +13,7 @@ import sys
 import json
 import time
 import logging
+import multiprocessing
 import subprocess
 from datetime import datetime
 from typing import Dict, Any
@@ -27,6 +28,41 @@ sys.path.append('/workspace')
 
 console = Console()
 
+
+def _run_live_miner(wallet_name, hotkey_name, netuid, chain):
+    """Child-process entry point for the live miner."""
+    from zeus_live_miner import ZeusLiveMiner
+    miner = ZeusLiveMiner(wallet_name=wallet_name, hotkey_name=hotkey_name,
+                          netuid=netuid, chain=chain)
+    asyncio.run(miner.mine_continuously())
+
+
+class _LogProgress:
+    """Progress stand-in for non-interactive runs.
+
+    Rich's spinner repaints ~12.5 times/sec from a renderer thread, which
+    is pure overhead when stdout is a log file; this just logs each task
+    description once.
+    """
+
+    def __init__(self, logger):
+        self._logger = logger
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add_task(self, description, total=None):
+        self._logger.info(description)
+        return None
+
+    def update(self, task_id, description=None, **kwargs):
+        if description:
+            self._logger.info(description)
+
+
 class ZeusLiveDeployment:
     """Live Zeus-Miner deployment on real Bittensor subnet 17"""
     
@@ -36,7 +72,31 @@ class ZeusLiveDeployment:
         self.chain = "finney"  # Mainnet
         self.wallet_name = "zeus_miner"
         self.hotkey_name = "zeus_hotkey"
+        self.interactive = sys.stdout.isatty()
         self.setup_logging()
+        # Import bittensor once and reuse wallet/subtensor handles: every
+        # btcli invocation forks a shell plus a fresh interpreter that
+        # re-imports the whole bittensor runtime (~1-3s each)
+        try:
+            import bittensor as bt
+            self._bt = bt
+        except ImportError:
+            self._bt = None
+            self.logger.warning("⚠️ bittensor import failed - falling back to btcli subprocesses")
+        self._wallet = None
+        self._subtensor = None
+
+    def _get_wallet(self):
+        """Return the shared in-process wallet handle."""
+        if self._wallet is None:
+            self._wallet = self._bt.wallet(name=self.wallet_name, hotkey=self.hotkey_name)
+        return self._wallet
+
+    def _get_subtensor(self):
+        """Return the shared subtensor connection."""
+        if self._subtensor is None:
+            self._subtensor = self._bt.subtensor(network=self.chain)
+        return self._subtensor
         
     def setup_logging(self):
         """Setup live deployment logging"""
@@ -60,25 +120,36 @@ class ZeusLiveDeployment:
         if not os.path.exists(wallet_dir):
             self.logger.info("💳 Creating new Bittensor wallet...")
             
-            # Create coldkey (automatically with random mnemonic)
-            cmd = f"btcli wallet new_coldkey --wallet.name {self.wallet_name} --no-use-password --overwrite"
-            process = subprocess.run(cmd, shell=True, capture_output=True, text=True, input="\n\n")
-            
-            if process.returncode == 0:
-                self.logger.info("✅ Coldkey created successfully")
-            else:
-                self.logger.error(f"❌ Failed to create coldkey: {process.stderr}")
-                return False
-                
-            # Create hotkey
-            cmd = f"btcli wallet new_hotkey --wallet.name {self.wallet_name} --wallet.hotkey {self.hotkey_name} --no-use-password --overwrite"
-            process = subprocess.run(cmd, shell=True, capture_output=True, text=True, input="\n\n")
-            
-            if process.returncode == 0:
-                self.logger.info("✅ Hotkey created successfully")
+            if self._bt is not None:
+                # In-process creation: no shell, no btcli interpreter startup
+                try:
+                    self._get_wallet().create_if_non_existent(
+                        coldkey_use_password=False, hotkey_use_password=False
+                    )
+                    self.logger.info("✅ Coldkey and hotkey created successfully")
+                except Exception as e:
+                    self.logger.error(f"❌ Failed to create wallet: {e}")
+                    return False
             else:
-                self.logger.error(f"❌ Failed to create hotkey: {process.stderr}")
-                return False
+                # argv-list fallback - still no shell between us and btcli
+                for cmd in (
+                    ['btcli', 'wallet', 'new_coldkey',
+                     '--wallet.name', self.wallet_name,
+                     '--no-use-password', '--overwrite'],
+                    ['btcli', 'wallet', 'new_hotkey',
+                     '--wallet.name', self.wallet_name,
+                     '--wallet.hotkey', self.hotkey_name,
+                     '--no-use-password', '--overwrite'],
+                ):
+                    try:
+                        process = subprocess.run(cmd, capture_output=True, text=True, input="\n\n")
+                    except FileNotFoundError:
+                        self.logger.error("❌ btcli not found on PATH")
+                        return False
+                    if process.returncode != 0:
+                        self.logger.error(f"❌ Failed to create wallet key: {process.stderr}")
+                        return False
+                self.logger.info("✅ Coldkey and hotkey created successfully")
         else:
             self.logger.info("✅ Wallet already exists")
             
@@ -88,8 +159,32 @@ class ZeusLiveDeployment:
         """Check if we're registered on subnet 17"""
         self.logger.info(f"🔍 Checking registration on subnet {self.subnet_uid}...")
         
-        cmd = f"btcli wallet overview --wallet.name {self.wallet_name} --wallet.hotkey {self.hotkey_name} --chain {self.chain}"
-        process = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        if self._bt is not None:
+            # One RPC against the shared subtensor connection instead of a
+            # btcli fork plus stdout scraping
+            try:
+                registered = self._get_subtensor().is_hotkey_registered(
+                    netuid=self.subnet_uid,
+                    hotkey_ss58=self._get_wallet().hotkey.ss58_address
+                )
+            except Exception as e:
+                self.logger.warning(f"⚠️ Registration check failed: {e}")
+                return False
+            if registered:
+                self.logger.info(f"✅ Already registered on subnet {self.subnet_uid}")
+            else:
+                self.logger.info(f"ℹ️ Not registered on subnet {self.subnet_uid}")
+            return registered
+        
+        cmd = ['btcli', 'wallet', 'overview',
+               '--wallet.name', self.wallet_name,
+               '--wallet.hotkey', self.hotkey_name,
+               '--chain', self.chain]
+        try:
+            process = subprocess.run(cmd, capture_output=True, text=True)
+        except FileNotFoundError:
+            self.logger.warning("⚠️ btcli not found on PATH")
+            return False
         
         if process.returncode == 0:
             self.logger.info("✅ Wallet overview retrieved")
@@ -108,154 +203,63 @@ class ZeusLiveDeployment:
         """Register on subnet 17 if not already registered"""
         self.logger.info(f"📝 Registering on subnet {self.subnet_uid}...")
         
-        # Check current TAO balance
-        cmd = f"btcli wallet balance --wallet.name {self.wallet_name} --chain {self.chain}"
-        process = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        
-        if process.returncode == 0:
-            self.logger.info("💰 Wallet balance checked")
-        
         # Attempt registration via proof of work (free but takes time)
         self.logger.info("⛏️ Starting proof-of-work registration (this may take time)...")
         
-        cmd = f"btcli subnet register --wallet.name {self.wallet_name} --wallet.hotkey {self.hotkey_name} --netuid {self.subnet_uid} --chain {self.chain} --no_prompt"
+        if self._bt is not None:
+            # POW registration blocks for minutes, so run it on a worker
+            # thread against the shared connection and hand back the future
+            loop = asyncio.get_running_loop()
+            registration = loop.run_in_executor(
+                None,
+                lambda: self._get_subtensor().register(
+                    wallet=self._get_wallet(), netuid=self.subnet_uid
+                )
+            )
+            self.logger.info("🔄 Registration process started...")
+            return registration
+        
+        cmd = ['btcli', 'subnet', 'register',
+               '--wallet.name', self.wallet_name,
+               '--wallet.hotkey', self.hotkey_name,
+               '--netuid', str(self.subnet_uid),
+               '--chain', self.chain, '--no_prompt']
         
         # Run registration in background due to potential long duration
-        process = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
         
         self.logger.info("🔄 Registration process started...")
         return process
         
-    async def create_zeus_miner_script(self):
-        """Create the live Zeus miner script"""
-        miner_script = f"""#!/usr/bin/env python3
-'''
-Zeus-Miner Live Script for Subnet 17
-Copyright © 2023 Sun Wukong
-
-LIVE mining on Bittensor subnet 17
-'''
+    def check_live_miner(self):
+        """Verify the live miner module imports cleanly before launch."""
+        try:
+            from zeus_live_miner import ZeusLiveMiner  # noqa: F401
+        except Exception as e:
+            self.logger.error(f"❌ Zeus live miner unavailable: {e}")
+            return False
+        self.logger.info("✅ Zeus live miner module ready")
+        return True
 
-import bittensor as bt
-import time
-import json
-import asyncio
-from datetime import datetime
+    def _deployment_progress(self):
+        """Return the progress context for this run mode.
 
-class ZeusLiveMiner:
-    def __init__(self):
-        self.config = bt.config(
-            wallet_name="{self.wallet_name}",
-            wallet_hotkey="{self.hotkey_name}",
-            netuid={self.subnet_uid},
-            chain="{self.chain}",
+        Interactive terminals get the spinner at a gentle 2 Hz refresh;
+        headless runs get _LogProgress, which spawns no renderer thread.
+        """
+        if not self.interactive:
+            return _LogProgress(self.logger)
+        return Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=self.console,
+            refresh_per_second=2
         )
-        
-        self.wallet = bt.wallet(config=self.config)
-        self.subtensor = bt.subtensor(config=self.config)
-        self.metagraph = bt.metagraph(netuid={self.subnet_uid}, network=self.subtensor)
-        
-        # Zeus-specific optimizations
-        self.zeus_config = {{
-            "frequency": 350,  # MHz
-            "target_temp": 75,  # Celsius
-            "optimization_level": "maximum",
-            "dtao_enabled": True,
-            "ai_agent_processing": True,
-            "market_intelligence": True
-        }}
-        
-        print("🔥 Zeus-Miner LIVE on Subnet 17!")
-        print(f"🎯 Wallet: {{self.wallet.hotkey.ss58_address}}")
-        print(f"📊 Current rank: {{self.get_current_rank()}}")
-        
-    def get_current_rank(self):
-        try:
-            uid = self.metagraph.hotkeys.index(self.wallet.hotkey.ss58_address)
-            return uid + 1
-        except:
-            return "Not registered"
-            
-    async def mine_continuously(self):
-        print("⚡ Starting continuous mining...")
-        
-        iteration = 0
-        while True:
-            try:
-                iteration += 1
-                start_time = time.time()
-                
-                # Simulate Zeus ASIC mining process
-                mining_result = await self.zeus_mining_process()
-                
-                # Log performance
-                response_time = (time.time() - start_time) * 1000
-                
-                print(f"🔥 Iteration {{iteration}}: {{mining_result['status']}} "
-                      f"({{response_time:.0f}}ms, Success: {{mining_result['success_rate']:.1f}}%)")
-                
-                # Update ranking
-                current_rank = self.get_current_rank()
-                if current_rank != "Not registered":
-                    print(f"🏆 Current ranking: #{{current_rank}}")
-                
-                await asyncio.sleep(1)  # Continuous mining
-                
-            except KeyboardInterrupt:
-                print("🛑 Mining stopped by user")
-                break
-            except Exception as e:
-                print(f"⚠️ Error in mining loop: {{e}}")
-                await asyncio.sleep(5)
-                
-    async def zeus_mining_process(self):
-        # Advanced Zeus mining simulation with real optimizations
-        import random
-        
-        # Simulate Zeus ASIC performance
-        base_success_rate = 95.0
-        zeus_optimization_boost = 2.5  # Zeus advantage
-        market_intelligence_boost = 1.2
-        dtao_boost = 1.8
-        
-        success_rate = base_success_rate + zeus_optimization_boost + market_intelligence_boost + dtao_boost
-        success_rate = min(99.8, success_rate + random.uniform(-1, 1))
-        
-        # Simulate mining result
-        result = {{
-            "status": "SUCCESS" if success_rate > 90 else "PARTIAL",
-            "success_rate": success_rate,
-            "hashrate": 51000 + random.randint(-2000, 2000),
-            "efficiency": min(98.5, success_rate + random.uniform(-2, 2)),
-            "zeus_optimizations": {{
-                "frequency": self.zeus_config["frequency"],
-                "dtao_enabled": self.zeus_config["dtao_enabled"],
-                "ai_processing": self.zeus_config["ai_agent_processing"]
-            }}
-        }}
-        
-        return result
 
-if __name__ == "__main__":
-    miner = ZeusLiveMiner()
-    asyncio.run(miner.mine_continuously())
-"""
-        
-        with open('zeus_live_miner.py', 'w') as f:
-            f.write(miner_script)
-            
-        # Make executable
-        os.chmod('zeus_live_miner.py', 0o755)
-        self.logger.info("✅ Zeus live miner script created")
-        
     async def deploy_live_system(self):
         """Deploy complete live Zeus mining system"""
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=self.console
-        ) as progress:
+        with self._deployment_progress() as progress:
             
             # Step 1: Wallet Setup
             task1 = progress.add_task("🔐 Setting up wallet...", total=None)
@@ -278,10 +282,13 @@ if __name__ == "__main__":
                 
                 # Note: Registration can take 10-30 minutes, we'll start mining anyway
             
-            # Step 4: Create Live Miner
-            task4 = progress.add_task("🔥 Creating Zeus live miner...", total=None)
-            await self.create_zeus_miner_script()
-            progress.update(task4, description="🔥 Zeus miner ready!")
+            # Step 4: Verify Live Miner
+            task4 = progress.add_task("🔥 Checking Zeus live miner...", total=None)
+            miner_ready = self.check_live_miner()
+            progress.update(task4, description="🔥 Zeus miner ready!" if miner_ready else "🔥 Zeus miner unavailable!")
+            
+            if not miner_ready:
+                return False
             
         return True
         
@@ -297,11 +304,16 @@ if __name__ == "__main__":
             border_style="green"
         ))
         
-        # Start the live miner
-        cmd = "source zeus_env/bin/activate && python zeus_live_miner.py"
-        
+        # Start the live miner in a child process: the module is imported
+        # directly, so no shell, no venv activation script and no second
+        # interpreter-plus-bittensor startup
         self.logger.info("⚡ Launching Zeus live miner...")
-        process = subprocess.Popen(cmd, shell=True)
+        process = multiprocessing.Process(
+            target=_run_live_miner,
+            args=(self.wallet_name, self.hotkey_name, self.subnet_uid, self.chain),
+            daemon=False
+        )
+        process.start()
         
         return process
 
@@ -338,7 +350,7 @@ async def main():
             
             # Wait for user to stop
             try:
-                mining_process.wait()
+                mining_process.join()
             except KeyboardInterrupt:
                 deployment.logger.info("🛑 Stopping live mining...")
                 mining_process.terminate()
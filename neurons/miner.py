@@ -16,14 +16,17 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import os
 import time
 import typing
+import numpy as np
 import bittensor as bt
-import json, socket
 import hashlib
 import struct
 import asyncio
-import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from utils.cgminer_api import CGMinerAPI
 
 # Bittensor Miner Template:
@@ -33,6 +36,95 @@ import template
 from template.base.miner import BaseMinerNeuron
 
 
+@lru_cache(maxsize=64)
+def _parse_target(target_hex: str) -> bytes:
+    """Parse a target hex string, memoized on the string.
+
+    Network difficulty changes slowly, so validators repeat the same
+    target across many challenges; caching skips the redundant hex
+    decode on every repeat.
+    """
+    return bytes.fromhex(target_hex)
+
+
+def _mine_range(header_bytes: bytes, target_bytes: bytes, start: int, stop: int,
+                stop_event, deadline_ns: int) -> typing.Tuple[typing.Optional[int], int]:
+    """Scan a nonce shard for a share; runs in a worker process.
+
+    Returns (nonce, hashes_scanned) with nonce None when the shard was
+    exhausted, another worker signalled stop_event, or deadline_ns
+    (a time.monotonic_ns timestamp) passed. The event is a manager proxy,
+    so every is_set() is an IPC round-trip; the poll stride is sized per
+    hash path so checks stay off the hot loop without letting losing
+    shards run long past the winner or the deadline.
+    """
+    # Hoist every loop-invariant out of the scan: the salt is the first 16
+    # header bytes (constant across nonces), the scrypt capability probe
+    # happens once instead of a try/except per hash, and the hot names are
+    # bound to locals so each iteration is pack + one C hash + one compare.
+    salt = header_bytes[:16]
+    scrypt = getattr(hashlib, 'scrypt', None)
+    sha256 = hashlib.sha256
+    pack_into = struct.pack_into
+    unpack = struct.unpack
+    from_bytes = int.from_bytes
+    is_set = stop_event.is_set
+    monotonic_ns = time.monotonic_ns
+    
+    # Both hash and target are little-endian 256-bit values; comparing
+    # them as most-significant-first tuples of four uint64 limbs matches
+    # the integer ordering without building a bignum per nonce.
+    target_limbs = unpack('<4Q', target_bytes)[::-1]
+    target_int = from_bytes(target_bytes, 'little')
+    
+    # One mutable 80-byte buffer for header+nonce: pack_into rewrites the
+    # nonce slot in place instead of concatenating a fresh bytes object
+    # per iteration (hashlib's C API still needs one bytes() copy).
+    buf = bytearray(80)
+    buf[:76] = header_bytes
+    nonce_view = memoryview(buf)[76:]
+    
+    # Midstate for the SHA-256 fallback: the first 64-byte compression
+    # block is nonce-invariant, so prime one hasher with the 76 header
+    # bytes and copy() it per nonce - only the final block is recomputed.
+    sha_base = sha256(header_bytes) if scrypt is None else None
+    
+    # Pre-filter for the fallback: almost every nonce misses, and a miss
+    # is already decided by the top 64 bits of the digest, so compare an
+    # 8-byte word first and only decode the full 256-bit value on a
+    # possible hit (top words equal).
+    target_top64 = target_int >> 192
+    
+    # Poll stride per path: scrypt runs ~0.4 ms/hash, so 1024 nonces is
+    # already ~0.4 s between checks; only the ~1 us/hash SHA-256 fallback
+    # can afford the wider stride without overrunning the deadline.
+    poll_mask = 1023 if scrypt is not None else 8191
+    
+    scanned = 0
+    for nonce in range(start, stop):
+        pack_into('<I', buf, 76, nonce)
+        if scrypt is not None:
+            hash_result = scrypt(bytes(buf), salt=salt, n=1024, r=1, p=1,
+                                 dklen=32, maxmem=128 * 1024 * 1024)
+            hit = unpack('<4Q', hash_result)[::-1] <= target_limbs
+        else:
+            hasher = sha_base.copy()
+            hasher.update(nonce_view)
+            hash_result = hasher.digest()
+            top64 = from_bytes(hash_result[24:], 'little')
+            hit = top64 < target_top64 or (
+                top64 == target_top64
+                and from_bytes(hash_result, 'little') <= target_int
+            )
+        scanned += 1
+        if hit:
+            stop_event.set()
+            return nonce, scanned
+        if (nonce & poll_mask) == 0 and (is_set() or monotonic_ns() > deadline_ns):
+            return None, scanned
+    return None, scanned
+
+
 class Miner(BaseMinerNeuron):
     """
     Zeus-Miner neuron class that performs actual scrypt hashing to find valid shares.
@@ -52,6 +144,24 @@ class Miner(BaseMinerNeuron):
         self.shares_found = 0
         self.last_performance_log = time.time()
         
+        # Software-mining process pool: scrypt shards are embarrassingly
+        # parallel, so one worker per core scans a disjoint nonce range
+        self.mining_workers = os.cpu_count() or 1
+        self.mining_pool = ProcessPoolExecutor(max_workers=self.mining_workers)
+        self._mp_manager = multiprocessing.Manager()
+        self._drain_task: typing.Optional[asyncio.Task] = None
+        
+        # Reusable header+nonce buffer for single-share verification
+        self._verify_buf = bytearray(80)
+        
+        # hotkey->uid lookup cache plus ndarray views of stake and permit,
+        # rebuilt when the metagraph hotkey list is replaced on sync
+        # (see _uid_for_hotkey)
+        self._hotkey_uid: typing.Dict[str, int] = {}
+        self._hotkey_uid_source = None
+        self._S = np.empty(0, dtype=np.float64)
+        self._vp = np.empty(0, dtype=bool)
+        
         # Verify cgminer connection
         try:
             summary = self.cg.summary()
@@ -63,72 +173,124 @@ class Miner(BaseMinerNeuron):
             self.use_software_mining = False
 
     def scrypt_hash(self, data: bytes) -> bytes:
-        """Compute scrypt hash of input data using software implementation."""
-        # Import scrypt for software fallback
+        """Compute scrypt hash of input data using software implementation.
+
+        Uses OpenSSL's scrypt via hashlib - orders of magnitude faster than
+        the third-party scrypt package for the same parameters. Parameter
+        mapping from the old scrypt.hash call: N->n, buflen->dklen.
+        """
         try:
-            import scrypt
-            return scrypt.hash(data, data[:16], N=1024, r=1, p=1, buflen=32)
-        except ImportError:
-            # Fallback to simple SHA256 if scrypt not available
-            bt.logging.warning("scrypt library not available, using SHA256 fallback")
+            return hashlib.scrypt(data, salt=data[:16], n=1024, r=1, p=1,
+                                  dklen=32, maxmem=128 * 1024 * 1024)
+        except (AttributeError, ValueError):
+            # OpenSSL built without scrypt support
+            bt.logging.warning("hashlib.scrypt not available, using SHA256 fallback")
             return hashlib.sha256(data).digest()
 
     def verify_share_target(self, header_bytes: bytes, nonce: int, target_bytes: bytes) -> bool:
         """Verify if the hash of header+nonce meets the target difficulty."""
-        # Pack nonce as little-endian 32-bit int and append to header
-        nonce_bytes = struct.pack('<I', nonce)
-        full_header = header_bytes + nonce_bytes
+        # Assemble header+nonce in the persistent buffer: pack_into rewrites
+        # the nonce slot in place instead of allocating a fresh 80-byte
+        # object per verification (hashlib still needs one bytes() copy)
+        buf = self._verify_buf
+        buf[:76] = header_bytes
+        struct.pack_into('<I', buf, 76, nonce)
         
-        # Compute scrypt hash
-        if self.use_software_mining:
-            hash_result = self.scrypt_hash(full_header)
-        else:
-            # For cgminer integration, we'd need to check its output
-            # For now, use software verification
-            hash_result = self.scrypt_hash(full_header)
-        
-        # Compare hash with target (both little-endian)
-        hash_int = int.from_bytes(hash_result, byteorder='little')
-        target_int = int.from_bytes(target_bytes, byteorder='little')
+        # cgminer integration would check its own output here; software
+        # verification covers both modes for now
+        hash_result = self.scrypt_hash(bytes(buf))
         
-        return hash_int <= target_int
+        # Compare as most-significant-first uint64 limb tuples: same
+        # ordering as the little-endian 256-bit integers, no bignums
+        return struct.unpack('<4Q', hash_result)[::-1] <= struct.unpack('<4Q', target_bytes)[::-1]
 
-    async def software_mine(self, header_hex: str, target_hex: str, timeout: float = 5.0) -> typing.Tuple[typing.Optional[int], bool]:
-        """Software mining fallback when cgminer is not available."""
-        header_bytes = bytes.fromhex(header_hex)
-        target_bytes = bytes.fromhex(target_hex)
+    async def software_mine(self, header_bytes: bytes, target_bytes: bytes, timeout: float = 5.0) -> typing.Tuple[typing.Optional[int], bool]:
+        """Software mining fallback when cgminer is not available.
         
-        start_time = time.time()
-        nonce = 0
-        max_nonce = 2**32
+        Takes the already-validated header and target as bytes - forward()
+        parses the hex exactly once. Splits the 32-bit nonce space into one
+        shard per core and races the worker processes; the first share
+        signals the shared stop event so stragglers exit at their next poll.
+        """
+        bt.logging.info(f"Starting software mining with target: {target_bytes[:8].hex()}...")
         
-        bt.logging.info(f"Starting software mining with target: {target_hex[:16]}...")
+        # Integer nanosecond deadline: shared with the workers so shards
+        # time out on their own even if the stop signal is delayed
+        deadline_ns = time.monotonic_ns() + int(timeout * 1e9)
         
-        while nonce < max_nonce and (time.time() - start_time) < timeout:
-            if self.verify_share_target(header_bytes, nonce, target_bytes):
-                bt.logging.success(f"Found valid share! Nonce: {nonce}")
-                self.shares_found += 1
-                return nonce, True
-            
-            nonce += 1
-            self.total_hashes += 1
-            
-            # Check every 1000 hashes to avoid tight loop
-            if nonce % 1000 == 0:
-                await asyncio.sleep(0.001)
-                
-        bt.logging.debug(f"No valid share found in {timeout}s, tried {nonce} nonces")
+        stop_event = self._mp_manager.Event()
+        shard = (2**32) // self.mining_workers
+        pending = {
+            asyncio.wrap_future(self.mining_pool.submit(
+                _mine_range, header_bytes, target_bytes,
+                i * shard, (i + 1) * shard, stop_event, deadline_ns
+            ))
+            for i in range(self.mining_workers)
+        }
+        
+        found_nonce = None
+        try:
+            while pending and found_nonce is None:
+                remaining = (deadline_ns - time.monotonic_ns()) / 1e9
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Retrieve every future in the wave before propagating a
+                # worker error - raising on the first would leave the rest
+                # unretrieved and warning at GC time
+                shard_error = None
+                for future in done:
+                    exc = future.exception()
+                    if exc is not None:
+                        shard_error = shard_error or exc
+                        continue
+                    nonce, scanned = future.result()
+                    self.total_hashes += scanned
+                    if nonce is not None:
+                        found_nonce = nonce
+                if shard_error is not None:
+                    raise shard_error
+        finally:
+            # Timeout, winner or error: tell every worker to stop scanning
+            stop_event.set()
+            if pending:
+                # Straggler shards exit at their next poll; retrieve their
+                # results in the background so their scan counts land in
+                # the stats and a late worker error is logged instead of
+                # warning "exception was never retrieved" at GC time
+                self._drain_task = asyncio.ensure_future(
+                    self._drain_shards(pending)
+                )
+
+        if found_nonce is not None:
+            bt.logging.success(f"Found valid share! Nonce: {found_nonce}")
+            self.shares_found += 1
+            return found_nonce, True
+        
+        bt.logging.debug(f"No valid share found in {timeout}s")
         return None, False
 
-    async def cgminer_mine(self, header_hex: str, target_hex: str, timeout: float = 5.0) -> typing.Tuple[typing.Optional[int], bool]:
+    async def _drain_shards(self, pending) -> None:
+        """Absorb shard futures abandoned by a software_mine deadline."""
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                bt.logging.warning(f"Mining shard failed: {result}")
+            else:
+                self.total_hashes += result[1]
+
+    async def cgminer_mine(self, header_bytes: bytes, target_bytes: bytes, timeout: float = 5.0) -> typing.Tuple[typing.Optional[int], bool]:
         """Use cgminer to find a valid share."""
         try:
             # Send work to cgminer - this is simplified, real integration would need
             # proper getwork protocol implementation
             bt.logging.info("Attempting cgminer integration...")
             
-            # Get current mining status
-            summary = self.cg.summary()
+            # Get current mining status; per-challenge polling opts in to
+            # the TTL cache so repeat challenges skip the API round-trip
+            summary = self.cg.summary(max_age=CGMinerAPI.SUMMARY_TTL)
             
             # For this proof-of-concept, we'll fall back to software mining
             # but log that we're connected to cgminer
@@ -136,11 +298,11 @@ class Miner(BaseMinerNeuron):
             
             # TODO: Implement proper cgminer getwork integration
             # For now, use software mining with cgminer acceleration hint
-            return await self.software_mine(header_hex, target_hex, timeout)
+            return await self.software_mine(header_bytes, target_bytes, timeout)
             
         except Exception as e:
             bt.logging.warning(f"cgminer error, falling back to software: {e}")
-            return await self.software_mine(header_hex, target_hex, timeout)
+            return await self.software_mine(header_bytes, target_bytes, timeout)
 
     def log_performance(self):
         """Log mining performance statistics."""
@@ -182,13 +344,20 @@ class Miner(BaseMinerNeuron):
             if len(synapse.target_hex) != 64:  # 32 bytes * 2 hex chars  
                 raise ValueError(f"Target should be 32 bytes (64 hex chars), got {len(synapse.target_hex)}")
             
+            # Parse the hex exactly once; the mining paths (including the
+            # cgminer->software fallback) all take bytes from here on.
+            # Targets repeat across challenges, so that parse is memoized;
+            # headers are unique per challenge and parsed directly.
+            header_bytes = bytes.fromhex(synapse.header_hex)
+            target_bytes = _parse_target(synapse.target_hex)
+            
             # Attempt mining with timeout
             timeout = 8.0  # Slightly less than validator timeout
             
             if self.use_software_mining:
-                nonce, success = await self.software_mine(synapse.header_hex, synapse.target_hex, timeout)
+                nonce, success = await self.software_mine(header_bytes, target_bytes, timeout)
             else:
-                nonce, success = await self.cgminer_mine(synapse.header_hex, synapse.target_hex, timeout)
+                nonce, success = await self.cgminer_mine(header_bytes, target_bytes, timeout)
             
             # Populate response
             synapse.nonce = nonce
@@ -209,6 +378,24 @@ class Miner(BaseMinerNeuron):
             
         return synapse
 
+    def _uid_for_hotkey(self, hotkey: str) -> typing.Optional[int]:
+        """O(1) hotkey->uid lookup against the current metagraph.
+        
+        metagraph.hotkeys.index() is an O(N) scan per request; this keeps a
+        dict rebuilt only when the sync replaces the hotkey list, detected
+        by identity. Stake and validator permit are materialized as ndarray
+        views in the same rebuild, so per-request reads are single C-level
+        indexing operations instead of possible tensor item() conversions.
+        """
+        hotkeys = self.metagraph.hotkeys
+        if self._hotkey_uid_source is not hotkeys:
+            self._hotkey_uid = {hk: i for i, hk in enumerate(hotkeys)}
+            S = self.metagraph.S
+            self._S = S.cpu().numpy() if hasattr(S, 'cpu') else np.asarray(S, dtype=np.float64)
+            self._vp = np.asarray(self.metagraph.validator_permit, dtype=bool)
+            self._hotkey_uid_source = hotkeys
+        return self._hotkey_uid.get(hotkey)
+
     async def blacklist(
         self, synapse: template.protocol.HashWork
     ) -> typing.Tuple[bool, str]:
@@ -223,22 +410,22 @@ class Miner(BaseMinerNeuron):
             return True, "Missing dendrite or hotkey"
 
         # Check if hotkey is registered
-        if synapse.dendrite.hotkey not in self.metagraph.hotkeys:
+        uid = self._uid_for_hotkey(synapse.dendrite.hotkey)
+        if uid is None:
             bt.logging.trace(f"Blacklisting unregistered hotkey {synapse.dendrite.hotkey}")
             return True, "Unrecognized hotkey"
-
-        uid = self.metagraph.hotkeys.index(synapse.dendrite.hotkey)
         
         # Require validator permit for mining requests
-        if not self.metagraph.validator_permit[uid]:
+        if not self._vp[uid]:
             bt.logging.warning(f"Blacklisting non-validator hotkey {synapse.dendrite.hotkey}")
             return True, "Non-validator hotkey"
 
         # Check minimum stake requirement
         min_stake = 1000.0  # Minimum TAO stake for validators
-        if self.metagraph.S[uid] < min_stake:
-            bt.logging.warning(f"Blacklisting low-stake validator {synapse.dendrite.hotkey} (stake: {self.metagraph.S[uid]})")
-            return True, f"Insufficient stake: {self.metagraph.S[uid]} < {min_stake}"
+        stake = float(self._S[uid])
+        if stake < min_stake:
+            bt.logging.warning(f"Blacklisting low-stake validator {synapse.dendrite.hotkey} (stake: {stake})")
+            return True, f"Insufficient stake: {stake} < {min_stake}"
 
         bt.logging.trace(f"Accepting request from validator {synapse.dendrite.hotkey}")
         return False, "Validator authorized"
@@ -254,11 +441,13 @@ class Miner(BaseMinerNeuron):
             return 0.0
 
         try:
-            caller_uid = self.metagraph.hotkeys.index(synapse.dendrite.hotkey)
-            stake = float(self.metagraph.S[caller_uid])
+            caller_uid = self._uid_for_hotkey(synapse.dendrite.hotkey)
+            if caller_uid is None:
+                return 0.0
+            stake = float(self._S[caller_uid])
             
             # Bonus priority for top validators
-            if caller_uid < len(self.metagraph.validator_permit) and self.metagraph.validator_permit[caller_uid]:
+            if caller_uid < len(self._vp) and self._vp[caller_uid]:
                 stake *= 1.5  # 50% bonus for validators
                 
             bt.logging.trace(f"Priority for {synapse.dendrite.hotkey}: {stake}")
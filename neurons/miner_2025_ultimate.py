@@ -22,8 +22,10 @@ import json
 import time
 import hashlib
 import struct
+import itertools
 import logging
 import threading
+from collections import deque
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -55,6 +57,28 @@ from utils.market_predictor import MarketPredictor
 # Set ultra-fast event loop
 asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
+# Attribute names that mark a synapse as AI-agent traffic; checked in
+# order of how common they are so the scan short-circuits early
+_AGENT_ATTRS = ('agent_id', 'agent_signature', 'transaction_batch',
+                'micro_payment', 'automated_transaction')
+
+# Method sophistication scores for response quality validation
+_METHOD_SCORES = {
+    'hybrid_processing': 0.3,
+    'zeus_parallel_mining': 0.25,
+    'synthetic_generation': 0.2,
+    'evm_smart_contract': 0.2,
+    'zeus_mining': 0.15
+}
+
+# Stable numeric ids for methods in the metrics ring (column 2)
+_METHOD_IDS = {name: float(i) for i, name in enumerate(_METHOD_SCORES)}
+
+# Attributes folded into the fallback liveness tag - enough to make the
+# tag request-specific without serializing the whole synapse
+_FALLBACK_TAG_ATTRS = ('header_hex', 'target_hex', 'agent_id',
+                       'contract_address', 'data_type')
+
 @dataclass
 class MinerConfig2025:
     """Advanced 2025 miner configuration."""
@@ -100,25 +124,70 @@ class MinerConfig2025:
     predictive_maintenance: bool = True
     quantum_ready: bool = True  # Future-proofing
     
+    # Model Inference
+    compile_models: bool = True
+    compile_mode: str = "reduce-overhead"
+    inference_dtype: str = "bfloat16"  # Small-batch inference is bandwidth-bound
+    
     # Security & Anti-Detection
     stealth_mode: bool = True
     anti_fingerprinting: bool = True
     distributed_identity: bool = True
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """JSON log formatter that amortizes timestamp rendering.
+
+    %(asctime)s normally costs a localtime + strftime per record; this
+    caches the rendered second and only re-appends the milliseconds, so
+    repeated logs within the same second skip the expensive calls while
+    producing byte-identical output.
+    """
+
+    def __init__(self, fmt: str):
+        super().__init__(fmt)
+        self._last_second = -1
+        self._cached_time = ""
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._last_second:
+            self._cached_time = time.strftime(
+                self.default_time_format, time.localtime(second)
+            )
+            self._last_second = second
+        return self.default_msec_format % (self._cached_time, record.msecs)
+
+
 class UltimateMiner2025:
     """The most advanced Bittensor miner ever created for 2025 dominance."""
     
+    # Request batching: synapses arriving within the window are coalesced
+    # so market analysis runs once per batch instead of once per request
+    MAX_BATCH = 16
+    BATCH_WINDOW_MS = 10
+    
     def __init__(self, config: MinerConfig2025, netuid: int = 17):
         self.config = config
         self.netuid = netuid
         self.logger = self._setup_logging()
         
-        # Performance tracking
+        # Performance tracking: bounded ring buffer with running
+        # aggregates so stats stay O(1) however long the miner runs
         self.start_time = time.time()
         self.total_requests = 0
         self.successful_responses = 0
-        self.response_times = []
+        self.response_times = deque(maxlen=4096)
+        self._rt_sum = 0.0
+        self._sub_second_count = 0
+        self._request_counter = itertools.count(1)
+        
+        # Contiguous per-request metrics ring (SoA): columns are response
+        # time, success, method id, quality score, so stats run as
+        # vectorized reductions over one cache-friendly buffer
+        self._metrics = np.zeros((4096, 4), dtype=np.float32)
+        self._metrics_idx = 0
+        self._metrics_filled = 0
         self.earnings_tracker = {"tao": 0.0, "subnet_tokens": 0.0}
         
         # Advanced components
@@ -129,8 +198,17 @@ class UltimateMiner2025:
         self.evm_integrator = EVMIntegrator() if config.evm_compatibility else None
         self.market_predictor = MarketPredictor() if config.market_prediction else None
         
-        # Thread pool for maximum performance
-        self.executor = ThreadPoolExecutor(max_workers=32)
+        # Async paths run directly on the uvloop event loop; this small
+        # pool exists only for genuinely blocking C calls (cgminer ioctls)
+        self._blocking_pool = ThreadPoolExecutor(max_workers=2)
+        
+        # Adjustable ceiling on in-flight request processing
+        self._max_concurrency = 32
+        self._concurrency = asyncio.Semaphore(self._max_concurrency)
+        
+        # Request batching collector (created lazily on the running loop)
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_consumer: Optional[asyncio.Task] = None
         
         # Initialize all systems
         self._initialize_systems()
@@ -140,8 +218,8 @@ class UltimateMiner2025:
         logger = logging.getLogger("ZeusMiner2025")
         logger.setLevel(logging.INFO)
         
-        # JSON formatter for machine processing
-        formatter = logging.Formatter(
+        # JSON formatter for machine processing, with cached timestamps
+        formatter = _CachedTimeFormatter(
             '{"timestamp": "%(asctime)s", "level": "%(levelname)s", '
             '"message": "%(message)s", "module": "%(module)s"}'
         )
@@ -179,8 +257,42 @@ class UltimateMiner2025:
         if self.config.market_prediction:
             self._initialize_market_intelligence()
         
+        # Bake the per-request pipeline now that the flags are final
+        self._build_forward_pipeline()
+        
         self.logger.info("✅ All systems initialized - Ready for #1 domination")
     
+    def _build_forward_pipeline(self):
+        """Partially evaluate the forward pipeline against the config.
+        
+        The feature flags never change after startup, so the enabled steps
+        are assembled into flat tuples once instead of re-testing every
+        flag on every request.
+        """
+        pre = []
+        if self.config.ai_agent_mode:
+            pre.append(self._agent_pre_step)
+        self._pre_steps = tuple(pre)
+        
+        post = []
+        if self.config.dtao_enabled:
+            post.append(self._optimize_for_dtao)
+        post.append(self._validate_step)
+        self._post_steps = tuple(post)
+        
+        self._use_market = self.config.market_prediction
+        self._adapt_enabled = self.config.real_time_adaptation
+    
+    async def _agent_pre_step(self, synapse):
+        """Pipeline step: specialized handling for AI agent requests."""
+        if self._is_ai_agent_request(synapse):
+            synapse = await self._process_ai_agent_request(synapse)
+        return synapse
+    
+    async def _validate_step(self, result: Dict[str, Any], synapse) -> Dict[str, Any]:
+        """Pipeline step: response validation and enhancement."""
+        return await self._validate_and_enhance_response(result)
+    
     def _initialize_zeus_2025(self):
         """Initialize Zeus ASIC with 2025 optimizations."""
         self.logger.info("⚡ Initializing Zeus ASIC 2025 Edition")
@@ -194,8 +306,23 @@ class UltimateMiner2025:
         self.cgminer.enable_quantum_optimization(True)
         self.cgminer.enable_liquid_cooling_mode(True)
         
+        # Push the per-device mining profile once up front; the mining
+        # path re-sends it only after a tuning change marks it dirty
+        self._device_config_dirty = False
+        for device_id in range(self.cgminer.get_device_count()):
+            self._configure_device(device_id)
+        
         self.logger.info(f"🔥 Zeus ASIC optimized: {self.config.max_frequency}MHz, {self.config.thermal_limit}°C")
     
+    def _configure_device(self, device_id: int):
+        """Send the maximum-performance profile to one Zeus device."""
+        self.cgminer.configure_device(device_id, {
+            'frequency': self.config.max_frequency,
+            'intensity': 31,  # Maximum intensity
+            'worksize': 512,
+            'thread_concurrency': 32768
+        })
+    
     def _initialize_dtao(self):
         """Initialize dTAO optimization for subnet tokens."""
         self.logger.info("💰 Initializing dTAO Optimization")
@@ -214,8 +341,42 @@ class UltimateMiner2025:
         self.ai_agent_processor.enable_transaction_prediction()
         self.ai_agent_processor.setup_micro_payment_handling()
         
+        # Compile the prediction models for low-overhead inference
+        models = getattr(self.ai_agent_processor, 'prediction_models', None)
+        if models:
+            for name, model in models.items():
+                models[name] = self._compile_model(model)
+        
         self.logger.info("🔮 AI Agent processing ready - 90% transaction compatibility")
     
+    def _compile_model(self, model):
+        """Wrap a real nn.Module with torch.compile for inference.
+        
+        reduce-overhead mode replays CUDA graphs to cut per-step Python
+        and kernel-launch cost; a warm-up forward is issued here so the
+        first live request doesn't pay the compile latency. Mock models
+        (None placeholders) pass through untouched.
+        """
+        if not self.config.compile_models or not isinstance(model, nn.Module):
+            return model
+        
+        # Cast to the inference dtype first: BF16 halves memory bandwidth
+        # and uses tensor cores on Ampere+ without FP16's loss-scaling
+        # headaches, and the compile then specializes for that dtype
+        dtype = getattr(torch, self.config.inference_dtype, None)
+        if dtype is not None:
+            model = model.to(dtype)
+        
+        compiled = torch.compile(model, mode=self.config.compile_mode, fullgraph=False)
+        try:
+            example = torch.zeros(1, getattr(model, 'input_size', 8),
+                                  dtype=dtype or torch.float32)
+            with torch.no_grad():
+                compiled(example)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Model warm-up skipped: {e}")
+        return compiled
+    
     def _initialize_synthetic_data(self):
         """Initialize synthetic data generation capabilities."""
         self.logger.info("🧬 Initializing Synthetic Data Generation")
@@ -250,22 +411,126 @@ class UltimateMiner2025:
         """
         ULTIMATE 2025 forward method with all advanced features.
         
+        Enqueues the synapse on the batching collector and awaits its
+        result; requests landing within BATCH_WINDOW_MS share one market
+        analysis pass instead of each paying for their own.
+        
         Target: Sub-1-second response, 99.8% success rate
         """
-        start_time = time.time()
-        request_id = f"req_{int(time.time() * 1000000)}"
+        self._ensure_batch_consumer()
+        future = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((synapse, future))
+        return await future
+    
+    def _ensure_batch_consumer(self):
+        """Start (or restart) the batch consumer on the running loop.
+
+        The queue is created once and survives consumer restarts -
+        replacing it would orphan any requests still sitting in the old
+        queue, leaving their callers awaiting futures nobody resolves.
+        """
+        if self._batch_queue is None:
+            self._batch_queue = asyncio.Queue()
+        if self._batch_consumer is None or self._batch_consumer.done():
+            self._batch_consumer = asyncio.get_running_loop().create_task(
+                self._consume_batches()
+            )
+    
+    async def _consume_batches(self):
+        """Drain the request queue in batches of up to MAX_BATCH.
+        
+        Blocks for the first request, then keeps collecting until the
+        batch window closes or the batch is full, so a lone request still
+        sees at most BATCH_WINDOW_MS of added latency.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + self.BATCH_WINDOW_MS / 1000.0
+            while len(batch) < self.MAX_BATCH:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(
+                        self._batch_queue.get(), remaining
+                    ))
+                except asyncio.TimeoutError:
+                    break
+            await self._process_batch(batch)
+    
+    async def _process_batch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """Run one collected batch and resolve every caller's future.
+
+        Nothing may escape this frame: an exception crossing it would kill
+        the consumer task and leave every queued caller awaiting a future
+        that never resolves. A failed shared analysis degrades to the
+        per-request path, and a failure in batch dispatch itself resolves
+        the remaining futures with the same fallback a lone request gets.
+        """
+        # One market-intelligence pass for the whole batch. The analysis
+        # contract takes a single synapse, so the first request stands in
+        # for the batch - the market data and competitor state it feeds on
+        # are request-independent, which is what makes sharing sound.
+        market_context = None
+        if self.config.market_prediction:
+            try:
+                market_context = await self._analyze_market_context(batch[0][0])
+            except Exception as e:
+                # _forward_one re-runs the analysis per request and owns
+                # the recovery path, so a failed shared pass costs speed,
+                # not correctness
+                self.logger.warning(f"⚠️ Shared market analysis failed: {e}")
+
+        try:
+            results = await asyncio.gather(
+                *(self._limited_forward(synapse, market_context) for synapse, _ in batch),
+                return_exceptions=True
+            )
+
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        except Exception as e:
+            self.logger.error(f"❌ Batch dispatch failed: {e}")
+            for synapse, future in batch:
+                if future.done():
+                    continue
+                try:
+                    future.set_result(await self._minimal_fallback_response(synapse))
+                except Exception as fallback_error:
+                    future.set_exception(fallback_error)
+    
+    async def _limited_forward(self, synapse, market_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run one request under the adjustable concurrency limit."""
+        async with self._concurrency:
+            return await self._forward_one(synapse, market_context)
+    
+    async def _forward_one(self, synapse, market_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Process a single synapse (the pre-batching forward body)."""
+        # One monotonic capture per request: perf_counter can't go
+        # negative under NTP slew the way wall-clock deltas can, and the
+        # request id comes from a counter instead of another clock read
+        start_ns = time.perf_counter_ns()
+        request_id = f"req_{next(self._request_counter)}"
         
         try:
             self.total_requests += 1
-            self.logger.info(f"🚀 Processing request {request_id}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"🚀 Processing request {request_id}")
             
-            # Step 1: AI Agent Pre-processing (if AI agent request)
-            if self.config.ai_agent_mode and self._is_ai_agent_request(synapse):
-                synapse = await self._process_ai_agent_request(synapse)
+            # Step 1: Pre-processing pipeline (baked at startup)
+            for step in self._pre_steps:
+                synapse = await step(synapse)
             
-            # Step 2: Market Intelligence Analysis
-            if self.config.market_prediction:
-                market_context = await self._analyze_market_context(synapse)
+            # Step 2: Market Intelligence Analysis (shared across the batch)
+            if self._use_market:
+                if market_context is None:
+                    market_context = await self._analyze_market_context(synapse)
                 synapse.market_context = market_context
             
             # Step 3: Choose optimal processing path
@@ -280,26 +545,29 @@ class UltimateMiner2025:
             else:
                 result = await self._process_hybrid_mode(synapse)
             
-            # Step 4: dTAO Optimization
-            if self.config.dtao_enabled:
-                result = await self._optimize_for_dtao(result, synapse)
-            
-            # Step 5: Response validation and enhancement
-            validated_result = await self._validate_and_enhance_response(result)
+            # Steps 4-5: post-processing pipeline (dTAO optimization when
+            # enabled, then response validation and enhancement)
+            for step in self._post_steps:
+                result = await step(result, synapse)
+            validated_result = result
             
             # Performance tracking
-            response_time = time.time() - start_time
-            self.response_times.append(response_time)
+            response_time = (time.perf_counter_ns() - start_ns) / 1e9
+            self._record_response_time(
+                response_time,
+                method=validated_result.get('method', ''),
+                quality=validated_result.get('performance_metadata', {}).get('quality_score', 0.0)
+            )
             self.successful_responses += 1
             
             # Log performance
-            if response_time < 1.0:
-                self.logger.info(f"⚡ ULTRA-FAST: {response_time*1000:.1f}ms - Target achieved!")
-            else:
+            if response_time >= 1.0:
                 self.logger.warning(f"⏱️ Slow response: {response_time*1000:.1f}ms - Optimizing...")
+            elif self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"⚡ ULTRA-FAST: {response_time*1000:.1f}ms - Target achieved!")
             
             # Real-time adaptation
-            if self.config.real_time_adaptation:
+            if self._adapt_enabled:
                 await self._adapt_performance(response_time)
             
             return validated_result
@@ -316,17 +584,46 @@ class UltimateMiner2025:
                 # Last resort - return minimal valid response
                 return await self._minimal_fallback_response(synapse)
     
+    def _record_response_time(self, response_time: float, method: str = '',
+                              quality: float = 0.0, success: bool = True):
+        """Record one request in the ring buffers.
+        
+        Keeps the running aggregates exact and writes one row into the
+        contiguous metrics ring.
+        """
+        times = self.response_times
+        if len(times) == times.maxlen:
+            evicted = times[0]
+            self._rt_sum -= evicted
+            if evicted < 1.0:
+                self._sub_second_count -= 1
+        times.append(response_time)
+        self._rt_sum += response_time
+        if response_time < 1.0:
+            self._sub_second_count += 1
+        
+        row = self._metrics_idx
+        self._metrics[row, 0] = response_time
+        self._metrics[row, 1] = 1.0 if success else 0.0
+        self._metrics[row, 2] = _METHOD_IDS.get(method, -1.0)
+        self._metrics[row, 3] = quality
+        self._metrics_idx = (row + 1) % len(self._metrics)
+        if self._metrics_filled < len(self._metrics):
+            self._metrics_filled += 1
+    
     def _is_ai_agent_request(self, synapse) -> bool:
         """Detect if request is from an AI agent (90% of 2025 traffic)."""
-        # Check for AI agent signatures
-        agent_indicators = [
-            'agent_id' in str(synapse),
-            'micro_payment' in str(synapse),
-            'automated_transaction' in str(synapse),
-            hasattr(synapse, 'agent_signature'),
-            hasattr(synapse, 'transaction_batch')
-        ]
-        return any(agent_indicators)
+        # Typed attribute probes instead of substring scans over the
+        # serialized synapse; the verdict is cached on the synapse so
+        # repeat checks are a single attribute read
+        cached = getattr(synapse, '_is_agent', None)
+        if cached is None:
+            cached = any(hasattr(synapse, attr) for attr in _AGENT_ATTRS)
+            try:
+                synapse._is_agent = cached
+            except AttributeError:
+                pass  # Frozen synapse - just skip the memo
+        return cached
     
     async def _process_ai_agent_request(self, synapse):
         """Process AI agent requests with specialized handling."""
@@ -374,17 +671,23 @@ class UltimateMiner2025:
     
     def _select_processing_method(self, synapse) -> str:
         """Select optimal processing method based on request characteristics."""
+        # One fetch of the attribute dict instead of exception-backed
+        # hasattr probes; slotted objects fall back to an empty mapping
+        try:
+            attrs = vars(synapse)
+        except TypeError:
+            attrs = {}
         
         # AI agent requests - optimized path
-        if hasattr(synapse, 'agent_compatible') and synapse.agent_compatible:
+        if attrs.get('agent_compatible'):
             return "hybrid_mode"
         
         # Large data requests - synthetic data
-        if hasattr(synapse, 'data_size') and synapse.data_size > 1000000:
+        if attrs.get('data_size', 0) > 1000000:
             return "synthetic_data"
         
         # Smart contract requests - EVM processing
-        if hasattr(synapse, 'contract_address') or hasattr(synapse, 'evm_call'):
+        if 'contract_address' in attrs or 'evm_call' in attrs:
             return "evm_contract"
         
         # Default to Zeus mining for standard requests
@@ -397,21 +700,51 @@ class UltimateMiner2025:
         challenge_data = self._extract_challenge_data(synapse)
         
         # Ultra-fast Zeus mining
-        start_mining = time.time()
-        
-        # Use multiple Zeus devices in parallel
-        mining_tasks = []
-        for device_id in range(self.cgminer.get_device_count()):
-            task = self._mine_with_device(device_id, challenge_data)
-            mining_tasks.append(task)
+        start_mining = time.perf_counter_ns()
         
-        # Wait for first successful result
-        results = await asyncio.gather(*mining_tasks, return_exceptions=True)
+        # Config was pushed at startup; re-send only after tuning
+        # changed it, instead of one RPC round-trip per request
+        if self._device_config_dirty:
+            self._device_config_dirty = False
+            for device_id in range(self.cgminer.get_device_count()):
+                self._configure_device(device_id)
         
-        # Select best result
-        best_result = self._select_best_mining_result(results)
+        # Use multiple Zeus devices in parallel
+        mining_tasks = [
+            asyncio.ensure_future(self._mine_with_device(device_id, challenge_data))
+            for device_id in range(self.cgminer.get_device_count())
+        ]
         
-        mining_time = time.time() - start_mining
+        # Race the devices: take the first successful result and cancel
+        # the stragglers instead of waiting out the slowest device
+        deadline = time.monotonic() + self.config.target_response_time / 1000.0
+        best_result = None
+        results = []
+        pending = set(mining_tasks)
+        while pending and best_result is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                try:
+                    result = task.result()
+                except Exception as e:
+                    result = {"error": str(e), "success": False}
+                results.append(result)
+                if best_result is None and result.get('success'):
+                    best_result = result
+        
+        for task in pending:
+            task.cancel()
+        
+        # No winner inside the budget - fall back to scoring what finished
+        if best_result is None:
+            best_result = self._select_best_mining_result(results)
+        
+        mining_time = (time.perf_counter_ns() - start_mining) / 1e9
         
         return {
             "mining_result": best_result,
@@ -424,14 +757,6 @@ class UltimateMiner2025:
     async def _mine_with_device(self, device_id: int, challenge_data: bytes) -> Dict[str, Any]:
         """Mine using specific Zeus device."""
         try:
-            # Configure device for maximum performance
-            self.cgminer.configure_device(device_id, {
-                'frequency': self.config.max_frequency,
-                'intensity': 31,  # Maximum intensity
-                'worksize': 512,
-                'thread_concurrency': 32768
-            })
-            
             # Perform mining
             nonce, hash_result = await self.cgminer.mine_async(device_id, challenge_data)
             
@@ -597,16 +922,9 @@ class UltimateMiner2025:
         elif response_time < 2.0:
             score += 0.1
         
-        # Method sophistication score
-        method = result.get('method', 'basic')
-        method_scores = {
-            'hybrid_processing': 0.3,
-            'zeus_parallel_mining': 0.25,
-            'synthetic_generation': 0.2,
-            'evm_smart_contract': 0.2,
-            'zeus_mining': 0.15
-        }
-        score += method_scores.get(method, 0.1)
+        # Method sophistication score (shared table - nothing allocated
+        # per call)
+        score += _METHOD_SCORES.get(result.get('method', 'basic'), 0.1)
         
         return min(score, 1.0)
     
@@ -655,12 +973,17 @@ class UltimateMiner2025:
             self.cgminer.set_frequency(new_frequency)
             self.logger.info(f"🔥 Increased Zeus frequency to {new_frequency}MHz")
         
-        # Increase thread count
-        if hasattr(self.executor, '_max_workers'):
-            self.executor._max_workers = min(self.executor._max_workers + 4, 64)
+        # Raise the concurrency ceiling by releasing extra permits
+        grant = min(4, 64 - self._max_concurrency)
+        for _ in range(grant):
+            self._concurrency.release()
+        self._max_concurrency += grant
         
         # Enable turbo mode
         self.cgminer.enable_turbo_mode(True)
+        
+        # Frequency changed - devices need the new profile
+        self._device_config_dirty = True
     
     async def _emergency_recovery(self, synapse, error: str) -> Dict[str, Any]:
         """Emergency recovery when main processing fails."""
@@ -690,12 +1013,20 @@ class UltimateMiner2025:
     
     async def _minimal_fallback_response(self, synapse) -> Dict[str, Any]:
         """Minimal fallback response to maintain uptime."""
+        # Liveness tag from the few identifying attributes, hashed with
+        # blake2b - no full str(synapse) materialization and no SHA-256
+        # on the failure hot path
+        parts = [
+            str(getattr(synapse, attr))
+            for attr in _FALLBACK_TAG_ATTRS if hasattr(synapse, attr)
+        ]
+        payload = "\x00".join(parts).encode() if parts else str(synapse).encode()
         return {
             "success": True,
             "method": "minimal_fallback",
             "timestamp": time.time(),
             "fallback_reason": "emergency_recovery",
-            "basic_hash": hashlib.sha256(str(synapse).encode()).hexdigest()
+            "basic_hash": hashlib.blake2b(payload, digest_size=16).hexdigest()
         }
     
     def get_performance_stats(self) -> Dict[str, Any]:
@@ -704,12 +1035,15 @@ class UltimateMiner2025:
         if not self.response_times:
             return {"status": "no_data"}
         
-        avg_response_time = sum(self.response_times) / len(self.response_times)
+        avg_response_time = self._rt_sum / len(self.response_times)
         success_rate = self.successful_responses / max(1, self.total_requests)
         
-        # Calculate sub-1-second percentage
-        sub_second_responses = sum(1 for t in self.response_times if t < 1.0)
-        sub_second_percentage = sub_second_responses / len(self.response_times)
+        # Sub-1-second percentage from the incrementally maintained counter
+        sub_second_percentage = self._sub_second_count / len(self.response_times)
+        
+        # Vectorized reduction over the filled slice of the metrics ring
+        rows = self._metrics[:self._metrics_filled]
+        avg_quality_score = float(rows[:, 3].mean()) if len(rows) else 0.0
         
         # Calculate earnings
         uptime_hours = (time.time() - self.start_time) / 3600
@@ -721,6 +1055,7 @@ class UltimateMiner2025:
             "success_rate": success_rate,
             "avg_response_time_ms": avg_response_time * 1000,
             "sub_second_percentage": sub_second_percentage,
+            "avg_quality_score": avg_quality_score,
             "estimated_daily_tao": estimated_daily_earnings,
             "uptime_hours": uptime_hours,
             "zeus_devices": self.cgminer.get_device_count(),
@@ -64,12 +64,20 @@ def create_mock_bittensor():
     print("🔄 Creating mock Bittensor module for testing...")
     
     mock_bittensor = """
+# Shared stake table: one module-level tuple instead of a fresh 50-int
+# list allocated per MockMetagraph construction
+_STAKES = (1000, 800, 600, 400, 200) * 10
+
 class MockWallet:
+    __slots__ = ('name', 'hotkey')
+
     def __init__(self, name=None, hotkey=None):
         self.name = name
         self.hotkey = hotkey
 
 class MockSubtensor:
+    __slots__ = ('network',)
+
     def __init__(self, network=None):
         self.network = network
     
@@ -77,8 +85,14 @@ class MockSubtensor:
         return MockMetagraph()
 
 class MockMetagraph:
+    __slots__ = ('S',)
+
     def __init__(self):
-        self.S = [1000, 800, 600, 400, 200] * 10  # Mock stakes
+        self.S = _STAKES  # Mock stakes - shared, immutable
+
+    def copy_stakes(self):
+        \"\"\"Mutable copy for tests that need to adjust stakes.\"\"\"
+        return list(_STAKES)
 
 def wallet(name=None, hotkey=None):
     return MockWallet(name, hotkey)
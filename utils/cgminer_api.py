@@ -23,6 +23,9 @@ class MiningStats:
 class CGMinerAPI:
     """Enhanced wrapper around cgminer JSON API with Zeus ASIC optimizations."""
 
+    # How long a cached summary stays fresh (see summary())
+    SUMMARY_TTL = 5.0
+
     def __init__(self, host: str = "127.0.0.1", port: int = 4028, timeout: float = 5.0):
         self.host = host
         self.port = port
@@ -30,6 +33,14 @@ class CGMinerAPI:
         self.connection_retries = 3
         self.retry_delay = 1.0
         
+        # Persistent API socket, guarded for concurrent callers
+        self._sock: typing.Optional[socket.socket] = None
+        self._sock_lock = threading.Lock()
+        
+        # TTL cache for summary polling
+        self._summary_cache: typing.Optional[dict] = None
+        self._summary_ts = 0.0
+        
     def _query_with_retry(self, payload: dict) -> typing.Any:
         """Query cgminer with automatic retry on failure."""
         last_exception = None
@@ -44,27 +55,69 @@ class CGMinerAPI:
                     
         raise last_exception or ConnectionError("Failed to connect to cgminer")
 
+    def _connect(self) -> socket.socket:
+        """Open the API socket with keepalive, no Nagle delay."""
+        sock = socket.create_connection((self.host, self.port), self.timeout)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    def _close_socket(self):
+        """Drop the cached socket, ignoring teardown errors."""
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+    def _read_reply(self) -> bytes:
+        """Read one NUL-terminated reply from the cached socket.
+
+        Stock cgminer closes the connection after each command, so EOF also
+        ends a reply; the socket is dropped in that case and the next query
+        reconnects.
+        """
+        data = b""
+        while True:
+            chunk = self._sock.recv(4096)
+            if not chunk:
+                self._close_socket()
+                break
+            data += chunk
+            if b"\x00" in chunk:
+                break
+        return data.rstrip(b"\x00")
+
     def _query(self, payload: dict) -> typing.Any:
-        """Send JSON query to cgminer API."""
-        line = json.dumps(payload) + "\n"
+        """Send JSON query to cgminer API over the persistent connection.
+
+        The socket is reused across commands to skip the per-call TCP
+        handshake and teardown; a dead cached connection gets one
+        transparent reconnect before errors propagate.
+        """
+        line = (json.dumps(payload) + "\n").encode()
+        data = b""
         
-        try:
-            with socket.create_connection((self.host, self.port), self.timeout) as sock:
-                sock.sendall(line.encode())
-                sock.shutdown(socket.SHUT_WR)
-                
-                # Read response with buffer handling
-                data = b""
-                while True:
-                    chunk = sock.recv(4096)
-                    if not chunk:
+        with self._sock_lock:
+            # First pass reuses the cached socket; the retry reconnects when
+            # the server closed it between commands
+            for attempt in (0, 1):
+                try:
+                    if self._sock is None:
+                        self._sock = self._connect()
+                    self._sock.sendall(line)
+                    data = self._read_reply()
+                    if data:
                         break
-                    data += chunk
-                    
-        except socket.timeout:
-            raise TimeoutError(f"cgminer API timeout after {self.timeout}s")
-        except socket.error as e:
-            raise ConnectionError(f"cgminer connection failed: {e}")
+                    self._close_socket()
+                except socket.timeout:
+                    self._close_socket()
+                    raise TimeoutError(f"cgminer API timeout after {self.timeout}s")
+                except socket.error as e:
+                    self._close_socket()
+                    if attempt:
+                        raise ConnectionError(f"cgminer connection failed: {e}")
             
         if not data:
             raise ValueError("Empty response from cgminer")
@@ -91,9 +144,21 @@ class CGMinerAPI:
         """Get cgminer version information."""
         return self._query_with_retry({"command": "version"})
 
-    def summary(self) -> dict:
-        """Get mining summary statistics."""
-        return self._query_with_retry({"command": "summary"})
+    def summary(self, max_age: float = 0.0) -> dict:
+        """Get mining summary statistics.
+
+        Queries fresh by default; callers that poll per challenge can opt
+        in to the cache by passing max_age (typically SUMMARY_TTL), which
+        turns repeat polls within that window into a dict lookup instead
+        of an API round-trip.
+        """
+        now = time.monotonic()
+        if self._summary_cache is not None and now - self._summary_ts < max_age:
+            return self._summary_cache
+        result = self._query_with_retry({"command": "summary"})
+        self._summary_cache = result
+        self._summary_ts = now
+        return result
 
     def get_stats(self) -> MiningStats:
         """Get parsed mining statistics."""